@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+import json
+import re
+
+ROOT_CLASS = "Object"
+
+# The class reference only states a superclass in prose for a few classes
+# (see extract_superclass), so the rest of the hierarchy is recorded here.
+# It follows the SLiM/Eidos sources: most SLiM classes are Dictionary
+# subclasses, while Haplosome and GenomicElement derive directly from Object.
+KNOWN_SUPERCLASSES = {
+    "Object": None,
+    "Dictionary": "Object",
+    "DataFrame": "Dictionary",
+    "Image": "Dictionary",
+    "Chromosome": "Dictionary",
+    "Community": "Dictionary",
+    "Haplosome": "Object",
+    "GenomicElement": "Object",
+    "GenomicElementType": "Dictionary",
+    "Individual": "Dictionary",
+    "InteractionType": "Dictionary",
+    "Mutation": "Dictionary",
+    "MutationType": "Dictionary",
+    "SLiMEidosBlock": "Dictionary",
+    "SLiMgui": "Dictionary",
+    "Species": "Dictionary",
+    "Subpopulation": "Dictionary",
+    "Substitution": "Dictionary",
+}
+
+
+def load_classes(docs_dir):
+    """Collect classes in the order DocumentationService loads them (Eidos overrides SLiM)."""
+    classes = {}
+    for file_name, source in [("slim_classes.json", "slim"), ("eidos_classes.json", "eidos")]:
+        with open(f"{docs_dir}/{file_name}", "r", encoding="utf-8") as f:
+            for name, info in json.load(f).items():
+                classes[name] = {**info, "source": source}
+    return classes
+
+
+def extract_superclass(class_name, class_info):
+    """Find the superclass stated in the reference, e.g. "Dictionary (its superclass)"."""
+    description = class_info.get("constructor", {}).get("description") or ""
+    match = re.search(r"(\w+) \(its superclass\)", description)
+    if match:
+        return match.group(1)
+    if class_name in KNOWN_SUPERCLASSES:
+        return KNOWN_SUPERCLASSES[class_name]
+    if class_name == ROOT_CLASS:
+        return None
+    print(f"⚠️ Warning: No superclass known for '{class_name}', assuming {ROOT_CLASS}; add it to KNOWN_SUPERCLASSES")
+    return ROOT_CLASS
+
+
+def collect_members(class_name, classes, superclasses, section):
+    """Own members first, then inherited ones; the closest definition wins."""
+    members = {}
+    current = class_name
+    while current:
+        for name, info in classes.get(current, {}).get(section, {}).items():
+            if name not in members:
+                members[name] = {**info, "definedIn": current}
+        current = superclasses.get(current)
+    return members
+
+
+def build_class_members(docs_dir):
+    classes = load_classes(docs_dir)
+    superclasses = {name: extract_superclass(name, info) for name, info in classes.items()}
+
+    for class_name, superclass in superclasses.items():
+        if superclass and superclass not in classes:
+            print(f"⚠️ Warning: Superclass '{superclass}' of '{class_name}' is not documented")
+
+    return {
+        class_name: {
+            "constructor": class_info.get("constructor", {}),
+            "superclass": superclasses[class_name],
+            "methods": collect_members(class_name, classes, superclasses, "methods"),
+            "properties": collect_members(class_name, classes, superclasses, "properties"),
+            "source": class_info["source"],
+        }
+        for class_name, class_info in classes.items()
+    }
+
+
+def main():
+    class_members = build_class_members("../docs")
+
+    for class_name, class_info in class_members.items():
+        inherited = sum(
+            1
+            for section in ("methods", "properties")
+            for info in class_info[section].values()
+            if info["definedIn"] != class_name
+        )
+        print(f"Flattened {class_name} (superclass {class_info['superclass']}): {inherited} inherited members")
+
+    # Write the result to a JSON file in docs folder
+    with open("../docs/class_members.json", "w", encoding="utf-8") as f:
+        json.dump(class_members, f, separators=(",", ":"))
+
+
+if __name__ == "__main__":
+    main()
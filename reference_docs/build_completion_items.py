@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+
+import json
+import re
+
+# CompletionItemKind values from the Language Server Protocol
+METHOD_KIND = 2
+FUNCTION_KIND = 3
+CLASS_KIND = 7
+PROPERTY_KIND = 10
+OPERATOR_KIND = 24
+
+# Mirrors expandTypeAbbreviations() in server/src/utils/text-processing.ts
+TYPE_ABBREVIATIONS = [
+    (r"\bNlif\b", "logical or integer or float"),
+    (r"\bNlis\b", "logical or integer or string"),
+    (r"\bNiso\b", "integer or string or object"),
+    (r"\bNif\b", "integer or float"),
+    (r"\bNis\b", "integer or string"),
+    (r"\bNio\b", "integer or object"),
+    (r"\bNfs\b", "float or string"),
+    (r"\bNli\b", "logical or integer"),
+    (r"\bNlo\b", "logical or object"),
+    (r"\biso(?=[\$<\s])", "integer or string or object"),
+    (r"\bio(?=[\$<\s])", "integer or object"),
+    (r"\bis(?=[\$<\s])", "integer or string"),
+    (r"\bNo<([^>]+)>", r"object<\1>"),
+    (r"\bNi\b", "integer"),
+    (r"\bNl\b", "logical"),
+    (r"\bNs\b", "string"),
+    (r"\bNf\b", "float"),
+    (r"\bNo\b", "object"),
+]
+
+
+def clean_type_names(text):
+    """Remove $ suffixes and expand type abbreviations, as cleanTypeNames() does."""
+    if not text:
+        return text
+    text = re.sub(r"(\w+(?:<[^>]+>)?)\$", r"\1", text)
+    for pattern, replacement in TYPE_ABBREVIATIONS:
+        text = re.sub(pattern, replacement, text)
+    return text
+
+
+def clean_signature(signature):
+    """Shorten object<Class> to <Class>, as cleanSignature() does."""
+    if not signature:
+        return signature
+    return re.sub(r"\bobject<([^>]+)>", r"<\1>", clean_type_names(signature), flags=re.I)
+
+
+def load_json(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_functions(docs_dir):
+    """Collect functions in the order DocumentationService loads them (Eidos overrides SLiM)."""
+    functions = {}
+    for file_name, source in [("slim_functions.json", "slim"), ("eidos_functions.json", "eidos")]:
+        for items in load_json(f"{docs_dir}/{file_name}").values():
+            for name, info in items.items():
+                if not info.get("signatures"):
+                    continue
+                signature = re.sub(r"^\([^)]+\)\s*", "", info["signatures"][0], count=1)
+                functions[name] = {"signature": signature, "source": source}
+    return functions
+
+
+def load_classes(docs_dir):
+    """Load the flattened member tables written by build_class_members.py."""
+    return load_json(f"{docs_dir}/class_members.json")
+
+
+def load_operators(docs_dir):
+    """Key operators by each symbol in their signature, as DocumentationService does."""
+    operators = {}
+    for info in load_json(f"{docs_dir}/eidos_operators.json").values():
+        signature = info.get("signature") or ""
+        for symbol in signature.split(","):
+            symbol = symbol.strip().replace('"', "").replace("'", "")
+            if symbol:
+                operators[symbol] = signature
+    return operators
+
+
+def is_available(source, mode):
+    return source == "eidos" or mode == "slim"
+
+
+def build_global_items(functions, classes, callbacks, operators, mode):
+    items = []
+
+    for name, info in functions.items():
+        if is_available(info["source"], mode):
+            items.append(
+                {
+                    "label": name,
+                    "kind": FUNCTION_KIND,
+                    "detail": clean_signature(info["signature"]),
+                    "sortText": f"2_{name}",
+                    "data": {"type": "function", "functionName": name},
+                }
+            )
+
+    for name, info in classes.items():
+        if is_available(info["source"], mode):
+            raw_signature = (info.get("constructor", {}).get("signature") or "").strip() or "None"
+            signature = clean_signature(raw_signature) if raw_signature != "None" else "None"
+            items.append(
+                {
+                    "label": name,
+                    "kind": CLASS_KIND,
+                    "detail": clean_signature(signature),
+                    "sortText": f"2_{name}",
+                    "data": {"type": "constructor", "className": name},
+                }
+            )
+
+    if mode == "slim":
+        for name, info in callbacks.items():
+            if not info.get("signature"):
+                continue
+            signature = re.sub(r"\s+(callbacks|events)$", "", info["signature"])
+            items.append(
+                {
+                    "label": name,
+                    "kind": FUNCTION_KIND,
+                    "detail": clean_signature(signature),
+                    "sortText": f"2_{name}",
+                    "data": {"type": "callback", "callbackName": name},
+                }
+            )
+
+    for symbol, signature in operators.items():
+        items.append(
+            {
+                "label": symbol,
+                "kind": OPERATOR_KIND,
+                "detail": clean_signature(signature),
+                "sortText": f"3_{symbol}",
+                "data": {"type": "operator", "operatorName": symbol},
+            }
+        )
+
+    return items
+
+
+def build_member_items(class_name, class_info):
+    items = []
+
+    for name, info in class_info.get("methods", {}).items():
+        items.append(
+            {
+                "label": name,
+                "kind": METHOD_KIND,
+                "detail": clean_signature(info["signature"]),
+                "data": {"type": "method", "className": class_name, "methodName": name},
+            }
+        )
+
+    for name, info in class_info.get("properties", {}).items():
+        items.append(
+            {
+                "label": name,
+                "kind": PROPERTY_KIND,
+                "detail": f"Type: {clean_type_names(info['type'])}",
+                "data": {"type": "property", "className": class_name, "propertyName": name},
+            }
+        )
+
+    return items
+
+
+def build_completion_items(docs_dir):
+    functions = load_functions(docs_dir)
+    classes = load_classes(docs_dir)
+    callbacks = load_json(f"{docs_dir}/slim_callbacks.json")
+    operators = load_operators(docs_dir)
+
+    return {
+        "globals": {
+            mode: build_global_items(functions, classes, callbacks, operators, mode)
+            for mode in ["eidos", "slim"]
+        },
+        "members": {
+            class_name: build_member_items(class_name, class_info)
+            for class_name, class_info in classes.items()
+        },
+    }
+
+
+def main():
+    items = build_completion_items("../docs")
+
+    for mode, mode_items in items["globals"].items():
+        print(f"Built {len(mode_items)} global completion items for {mode}")
+    print(f"Built member completion items for {len(items['members'])} classes")
+
+    # Write the result to a JSON file in docs folder
+    with open("../docs/completion_items.json", "w", encoding="utf-8") as f:
+        json.dump(items, f, separators=(",", ":"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+
+import json
+
+
+def levenshtein_distance(a, b):
+    """Compute the edit distance between two identifiers."""
+    if a == b:
+        return 0
+    if not a:
+        return len(b)
+    if not b:
+        return len(a)
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            cost = 0 if char_a == char_b else 1
+            current.append(
+                min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            )
+        previous = current
+    return previous[-1]
+
+
+def build_bk_tree(words):
+    """Build a BK-tree over the given words (sorted first so output is stable)."""
+    root = None
+    for word in sorted(set(words)):
+        if root is None:
+            root = {"word": word, "children": {}}
+            continue
+
+        node = root
+        while True:
+            distance = str(levenshtein_distance(word, node["word"]))
+            child = node["children"].get(distance)
+            if child is None:
+                node["children"][distance] = {"word": word, "children": {}}
+                break
+            node = child
+    return root
+
+
+def load_function_names(json_path):
+    with open(json_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    names = []
+    for functions in data.values():
+        names.extend(functions.keys())
+    return names
+
+
+def load_classes(json_path):
+    with open(json_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def build_fuzzy_index(docs_dir):
+    slim_functions = load_function_names(f"{docs_dir}/slim_functions.json")
+    eidos_functions = load_function_names(f"{docs_dir}/eidos_functions.json")
+    slim_classes = load_classes(f"{docs_dir}/slim_classes.json")
+    eidos_classes = load_classes(f"{docs_dir}/eidos_classes.json")
+
+    # Global identifiers: Eidos mode only sees Eidos names, SLiM mode sees both
+    eidos_globals = eidos_functions + list(eidos_classes.keys())
+    slim_globals = eidos_globals + slim_functions + list(slim_classes.keys())
+
+    # Member tables are flattened, so inherited members are matched too
+    class_members = load_classes(f"{docs_dir}/class_members.json")
+
+    members = {}
+    for class_name, class_info in class_members.items():
+        member_names = list(class_info.get("methods", {}).keys()) + list(
+            class_info.get("properties", {}).keys()
+        )
+        if member_names:
+            members[class_name] = build_bk_tree(member_names)
+
+    return {
+        "globals": {
+            "eidos": build_bk_tree(eidos_globals),
+            "slim": build_bk_tree(slim_globals),
+        },
+        "members": members,
+    }
+
+
+def main():
+    index = build_fuzzy_index("../docs")
+
+    print(f"Built global fuzzy index for {len(index['globals'])} language modes")
+    print(f"Built member fuzzy index for {len(index['members'])} classes")
+
+    # Write the result to a JSON file in docs folder
+    with open("../docs/fuzzy_index.json", "w", encoding="utf-8") as f:
+        json.dump(index, f, separators=(",", ":"))
+
+
+if __name__ == "__main__":
+    main()
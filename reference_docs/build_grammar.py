@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+
+import json
+import re
+
+GRAMMAR_PATH = "../syntaxes/slim.tmLanguage.json"
+
+# Generated repository entries are included just before this hand-written
+# catch-all pattern, so builtin names take precedence over it
+INSERT_BEFORE_SCOPE = "entity.name.function.slim"
+
+# Hand-written keyword list that precedes the generated includes; documented names
+# are removed from it so they get their generated scopes instead
+KEYWORD_SCOPE = "keyword.other.slim"
+
+
+def load_json(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_function_names(docs_dir):
+    names = set()
+    for file_name in ["eidos_functions.json", "slim_functions.json"]:
+        for functions in load_json(f"{docs_dir}/{file_name}").values():
+            names.update(functions.keys())
+    return names
+
+
+def load_class_names(docs_dir):
+    return set(load_json(f"{docs_dir}/class_members.json").keys())
+
+
+def load_callback_names(docs_dir):
+    """Callback names come from signatures like "mutationEffect()"; event names from the
+    declarations listed in the Eidos events description ("first() { ... }")."""
+    names = set()
+    for info in load_json(f"{docs_dir}/slim_callbacks.json").values():
+        match = re.match(r"^(\w+)\(\)$", info.get("signature", ""))
+        if match:
+            names.add(match.group(1))
+        names.update(re.findall(r"\b(\w+)\(\) \{", info.get("description", "")))
+    return names
+
+
+def load_type_names(docs_dir):
+    return set(load_json(f"{docs_dir}/eidos_types.json").keys())
+
+
+def load_member_names(docs_dir):
+    names = set()
+    for class_info in load_json(f"{docs_dir}/class_members.json").values():
+        names.update(class_info["methods"].keys())
+        names.update(class_info["properties"].keys())
+    return names
+
+
+def build_trie(words):
+    root = {}
+    for word in words:
+        node = root
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return root
+
+
+def trie_to_regex(node):
+    """Render a trie as a prefix-factored regex, e.g. {cat, car, cart} -> ca(?:rt?|t)."""
+    is_end = "" in node
+    branches = [re.escape(char) + trie_to_regex(child) for char, child in sorted(node.items()) if char]
+
+    if not branches:
+        return ""
+    if len(branches) == 1 and not is_end:
+        return branches[0]
+
+    if len(branches) == 1 and len(branches[0]) == 1:
+        group = branches[0]
+    else:
+        group = "(?:" + "|".join(branches) + ")"
+    return group + "?" if is_end else group
+
+
+def build_name_regex(words):
+    return trie_to_regex(build_trie(words))
+
+
+def verify_name_regex(regex, words, candidates):
+    """Check that the regex accepts exactly the same candidates as a flat alternation."""
+    trie_pattern = re.compile(regex)
+    flat_pattern = re.compile("|".join(re.escape(word) for word in sorted(words)))
+
+    mismatches = [
+        candidate
+        for candidate in sorted(candidates)
+        if bool(trie_pattern.fullmatch(candidate)) != bool(flat_pattern.fullmatch(candidate))
+    ]
+    if mismatches:
+        raise ValueError(f"Generated regex disagrees with the name list on: {mismatches[:10]}")
+
+
+def build_candidates(name_sets):
+    """Every documented name, each of its prefixes, and each name with a suffix appended."""
+    candidates = set()
+    for words in name_sets:
+        for word in words:
+            candidates.update(word[:i] for i in range(len(word) + 1))
+            candidates.add(word + "_")
+            candidates.add(word + "s")
+    return candidates
+
+
+def build_grammar_patterns(docs_dir):
+    """Return the generated repository entries, keyed by repository name."""
+    # Calls are only builtin when not preceded by '.', so "x.size()" stays a method call
+    call = (r"(?<!\.)", r"(?=\s*\()")
+    scopes = [
+        ("builtin-functions", "support.function.builtin.slim", load_function_names(docs_dir), call),
+        ("builtin-classes", "support.class.builtin.slim", load_class_names(docs_dir), ("", "")),
+        ("builtin-callbacks", "support.function.callback.slim", load_callback_names(docs_dir), call),
+        ("builtin-types", "support.type.builtin.slim", load_type_names(docs_dir), ("", "")),
+    ]
+    candidates = build_candidates(words for _, _, words, _ in scopes)
+
+    patterns = {}
+    for key, scope, words, (lookbehind, lookahead) in scopes:
+        regex = build_name_regex(words)
+        verify_name_regex(regex, words, candidates)
+        patterns[key] = {
+            "name": scope,
+            # Alternations only occur inside the trie's own groups, so no outer group is needed
+            "match": f"{lookbehind}\\b{regex}\\b{lookahead}",
+        }
+        print(f"Built {key}: {len(words)} names, {len(regex)} characters")
+    return patterns
+
+
+def update_grammar(grammar, patterns):
+    includes = [{"include": f"#{key}"} for key in patterns]
+    existing = [p for p in grammar["patterns"] if p not in includes]
+
+    insert_at = next(
+        (i for i, p in enumerate(existing) if p.get("name") == INSERT_BEFORE_SCOPE), len(existing)
+    )
+    grammar["patterns"] = existing[:insert_at] + includes + existing[insert_at:]
+    grammar["repository"] = {**grammar.get("repository", {}), **patterns}
+    return grammar
+
+
+def prune_keyword_pattern(grammar, documented_names):
+    """Drop documented names from the hand-written keyword alternation, and the pattern
+    itself once nothing is left. A pattern listed earlier wins at a given position,
+    so a name left there would never reach its generated scope."""
+    patterns = []
+    for pattern in grammar["patterns"]:
+        match = re.fullmatch(r"\\b\((.*)\)\\b", pattern.get("match", ""))
+        if pattern.get("name") == KEYWORD_SCOPE and match:
+            names = [name for name in match.group(1).split("|") if name not in documented_names]
+            removed = len(match.group(1).split("|")) - len(names)
+            print(f"Removed {removed} documented names from {KEYWORD_SCOPE}")
+            if not names:
+                continue
+            pattern = {**pattern, "match": f"\\b({'|'.join(names)})\\b"}
+        patterns.append(pattern)
+    grammar["patterns"] = patterns
+    return grammar
+
+
+def main():
+    docs_dir = "../docs"
+    patterns = build_grammar_patterns(docs_dir)
+    grammar = update_grammar(load_json(GRAMMAR_PATH), patterns)
+    grammar = prune_keyword_pattern(
+        grammar,
+        load_function_names(docs_dir) | load_callback_names(docs_dir) | load_member_names(docs_dir),
+    )
+
+    # Keep the hand-maintained file's formatting (tab indentation, no trailing newline)
+    with open(GRAMMAR_PATH, "w", encoding="utf-8") as f:
+        f.write(json.dumps(grammar, indent="\t", ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,468 @@
+#!/usr/bin/env python3
+
+"""Generate synthetic SLiM/Eidos scripts from the parsed reference in ../docs.
+
+The scripts are syntactically valid and fully determined by the seed, so they
+can be used as reproducible large workloads for the language server benchmarks.
+
+Example:
+    python generate_workload.py --language slim --seed 1 --statements 2000 \\
+        --max-depth 4 --call-density 0.5 --chain-length 3 -o workload.slim
+"""
+
+import argparse
+import json
+import random
+import re
+
+DOCS_DIR = "../docs"
+
+FULL_TYPE_NAMES = {
+    "integer": "i",
+    "float": "f",
+    "logical": "l",
+    "string": "s",
+    "numeric": "if",
+    "object": "o",
+}
+
+# Object-typed pseudo-parameters of the callbacks we emit
+CALLBACK_PSEUDO_PARAMETERS = {
+    "mutationEffect": {"mut": "Mutation"},
+    "fitnessEffect": {"individual": "Individual", "subpop": "Subpopulation"},
+    "mateChoice": {"individual": "Individual", "subpop": "Subpopulation"},
+    "modifyChild": {"child": "Individual", "parent1": "Individual", "subpop": "Subpopulation"},
+    "recombination": {"individual": "Individual", "subpop": "Subpopulation"},
+    "mutation": {"mut": "Mutation", "parent": "Individual", "subpop": "Subpopulation"},
+}
+
+# Declaration and return value of each callback we emit
+CALLBACK_DECLARATIONS = {
+    "mutationEffect": ("mutationEffect(m1)", "effect"),
+    "fitnessEffect": ("fitnessEffect()", "1.0"),
+    "mateChoice": ("mateChoice()", "weights"),
+    "modifyChild": ("modifyChild()", "T"),
+    "recombination": ("recombination()", "F"),
+    "mutation": ("mutation(m1)", "T"),
+}
+
+EVENT_NAMES = ["first", "early", "late"]
+
+# Functions that would redefine state, end the run, touch the filesystem, run
+# other code or processes, reseed the RNG, or change threading; the workloads are
+# meant to be safe to open and run anywhere, so these are never emitted
+EXCLUDED_FUNCTIONS = {
+    "beep",
+    "defineConstant",
+    "defineGlobal",
+    "doCall",
+    "executeLambda",
+    "parallelSetNumThreads",
+    "parallelSetTaskThreadCounts",
+    "rm",
+    "setSeed",
+    "source",
+    "stop",
+    "suppressWarnings",
+    "system",
+}
+
+# Whole documentation sections left out for the same reason
+EXCLUDED_SECTIONS = {"Filesystem access functions"}
+
+# Methods left out for the same reason: they read or write files, write log
+# rows, end the run, or drive the SLiMgui application
+EXCLUDED_METHODS = {
+    "createLogFile",
+    "flush",
+    "logRow",
+    "openDocument",
+    "outputFixedMutations",
+    "outputFull",
+    "outputHaplosomes",
+    "outputHaplosomesToMS",
+    "outputHaplosomesToVCF",
+    "outputIndividuals",
+    "outputIndividualsToVCF",
+    "outputMSSample",
+    "outputMutations",
+    "outputSample",
+    "outputVCFSample",
+    "pauseExecution",
+    "readFromPopulationFile",
+    "readHaplosomesFromMS",
+    "readHaplosomesFromVCF",
+    "readIndividualsFromVCF",
+    "setFilePath",
+    "simulationFinished",
+    "treeSeqOutput",
+    "write",
+}
+
+
+def normalize(text):
+    return text.replace("\xa0", " ").strip()
+
+
+def parse_type(spec):
+    """Parse a documentation type like 'No<Individual>$' or 'integer$'."""
+    spec = spec.strip()
+    singleton = spec.endswith("$")
+    spec = spec.rstrip("$")
+
+    class_match = re.search(r"o(?:bject)?<(\w+)>", spec)
+    class_name = class_match.group(1) if class_match else None
+    spec = re.sub(r"o(?:bject)?<\w+>", "o", spec)
+
+    nullable = spec.startswith("N")
+    if nullable:
+        spec = spec[1:]
+
+    letters = FULL_TYPE_NAMES.get(spec, spec)
+    return {
+        "letters": letters,
+        "class": class_name,
+        "singleton": singleton,
+        "nullable": nullable,
+    }
+
+
+def split_parameters(params_text):
+    """Split a parameter list on top-level commas."""
+    params = []
+    depth = 0
+    current = ""
+    for char in params_text:
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        if char == "," and depth == 0:
+            params.append(current.strip())
+            current = ""
+        else:
+            current += char
+    if current.strip():
+        params.append(current.strip())
+    return params
+
+
+def parse_signature(signature):
+    """Parse '(returnType)name(params)' into its return type and required parameter types."""
+    match = re.match(r"^\((.*?)\)\s*(\w+)\s*\((.*)\)$", normalize(signature))
+    if not match:
+        return None
+
+    required = []
+    for param in split_parameters(match.group(3)):
+        if param.startswith("[") or param == "...":
+            continue
+        parts = param.rsplit(" ", 1)
+        if len(parts) != 2:
+            return None
+        required.append(parse_type(parts[0]))
+
+    return {
+        "name": match.group(2),
+        "returns": parse_type(match.group(1)),
+        "required": required,
+    }
+
+
+def load_json(name):
+    with open(f"{DOCS_DIR}/{name}", "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_reference(language):
+    """Collect the classes, functions and callbacks available in a language mode."""
+    classes = dict(load_json("eidos_classes.json"))
+    function_files = ["eidos_functions.json"]
+    callbacks = []
+    if language == "slim":
+        classes.update(load_json("slim_classes.json"))
+        function_files.append("slim_functions.json")
+        for callback in load_json("slim_callbacks.json").values():
+            name = callback["signature"].replace("()", "")
+            if name in CALLBACK_DECLARATIONS:
+                callbacks.append(name)
+
+    members = {}
+    for class_name, class_info in classes.items():
+        methods = []
+        for method_info in class_info.get("methods", {}).values():
+            parsed = parse_signature(method_info["signature"])
+            if parsed:
+                methods.append(parsed)
+        properties = [
+            (name, parse_type(info["type"]))
+            for name, info in class_info.get("properties", {}).items()
+        ]
+        members[class_name] = {"methods": methods, "properties": properties}
+
+    functions = []
+    for file_name in function_files:
+        for section_name, section in load_json(file_name).items():
+            if section_name in EXCLUDED_SECTIONS:
+                continue
+            for function_name, function_info in section.items():
+                if function_name in EXCLUDED_FUNCTIONS or function_name.startswith("initialize"):
+                    continue
+                parsed = parse_signature(function_info["signatures"][0])
+                if parsed:
+                    functions.append(parsed)
+
+    return {"members": members, "functions": functions, "callbacks": callbacks}
+
+
+class WorkloadGenerator:
+    def __init__(self, reference, language, seed, max_depth, call_density, chain_length):
+        self.reference = reference
+        self.language = language
+        self.random = random.Random(seed)
+        self.max_depth = max_depth
+        self.call_density = call_density
+        self.chain_length = chain_length
+        self.counter = 0
+        self.user_functions = []
+
+    def fresh_name(self, prefix):
+        self.counter += 1
+        return f"{prefix}{self.counter}"
+
+    def literal(self, type_info, scope):
+        """Produce an argument expression satisfying a parameter type, or None."""
+        letters = type_info["letters"]
+        if "o" in letters:
+            candidates = [
+                name
+                for name, class_name in scope.items()
+                if type_info["class"] in (None, class_name)
+            ]
+            if candidates:
+                return self.random.choice(sorted(candidates))
+            return "NULL" if type_info["nullable"] else None
+        if "i" in letters or "+" in letters or "*" in letters:
+            return str(self.random.randint(0, 100))
+        if "f" in letters:
+            return f"{self.random.randint(1, 99) / 100}"
+        if "l" in letters:
+            return self.random.choice(["T", "F"])
+        if "s" in letters:
+            return f'"{self.fresh_name("key")}"'
+        return None
+
+    def call_arguments(self, signature, scope):
+        args = []
+        for param in signature["required"]:
+            arg = self.literal(param, scope)
+            if arg is None:
+                return None
+            args.append(arg)
+        return ", ".join(args)
+
+    def member_chain(self, scope):
+        """Build 'root.prop.prop.method(args)' and return it with its result type."""
+        root = self.random.choice(sorted(scope))
+        expression = root
+        class_name = scope[root]
+
+        for _ in range(self.random.randint(0, self.chain_length - 1)):
+            links = [
+                (name, info["class"])
+                for name, info in self.reference["members"].get(class_name, {}).get("properties", [])
+                if info["class"] in self.reference["members"]
+            ]
+            if not links:
+                break
+            name, class_name = self.random.choice(links)
+            expression += f".{name}"
+            if self.random.random() < 0.3:
+                expression += "[0]"
+
+        members = self.reference["members"].get(class_name, {})
+        methods = [m for m in members.get("methods", []) if m["name"] not in EXCLUDED_METHODS]
+        if methods and self.random.random() < self.call_density:
+            method = self.random.choice(methods)
+            args = self.call_arguments(method, scope)
+            if args is not None:
+                return f"{expression}.{method['name']}({args})", method["returns"]
+
+        if members.get("properties"):
+            name, info = self.random.choice(members["properties"])
+            return f"{expression}.{name}", info
+
+        return expression, parse_type(f"object<{class_name}>")
+
+    def function_call(self, scope):
+        candidates = self.reference["functions"] + self.user_functions
+        for _ in range(10):
+            function = self.random.choice(candidates)
+            args = self.call_arguments(function, scope)
+            if args is not None:
+                return f"{function['name']}({args})", function["returns"]
+        return "c()", parse_type("NULL")
+
+    def statement(self, scope, indent):
+        if scope and self.random.random() < 0.75:
+            expression, result_type = self.member_chain(scope)
+        else:
+            expression, result_type = self.function_call(scope)
+
+        if result_type["letters"] == "void":
+            return [f"{indent}{expression};"]
+
+        name = self.fresh_name("v")
+        if result_type["class"] in self.reference["members"]:
+            scope[name] = result_type["class"]
+        return [f"{indent}{name} = {expression};"]
+
+    def block(self, scope, depth, budget):
+        """Emit up to `budget` statements at this depth; returns (lines, statements used)."""
+        indent = "    " * depth
+        lines = []
+        used = 0
+        while used < budget:
+            if depth < self.max_depth and budget - used > 2 and self.random.random() < 0.2:
+                inner_scope = dict(scope)
+                inner_budget = self.random.randint(1, min(budget - used - 1, 20))
+                collection, result_type = self.member_chain(scope) if scope else (None, None)
+                if (
+                    result_type
+                    and result_type["class"] in self.reference["members"]
+                    and self.random.random() < 0.5
+                ):
+                    loop_var = self.fresh_name("item")
+                    inner_scope[loop_var] = result_type["class"]
+                    lines.append(f"{indent}for ({loop_var} in {collection}) {{")
+                elif self.random.random() < 0.5:
+                    loop_var = self.fresh_name("i")
+                    lines.append(f"{indent}for ({loop_var} in seqLen({self.random.randint(2, 10)})) {{")
+                else:
+                    threshold = self.random.randint(0, 100)
+                    lines.append(f"{indent}if (runif(1) * 100 > {threshold}) {{")
+                inner_lines, inner_used = self.block(inner_scope, depth + 1, inner_budget)
+                lines.extend(inner_lines)
+                lines.append(f"{indent}}}")
+                used += inner_used + 1
+            else:
+                lines.extend(self.statement(scope, indent))
+                used += 1
+        return lines, used
+
+    def user_function(self, budget):
+        name = self.fresh_name("userFunction")
+        lines = [f"function (float$){name}(integer$ n, float$ x) {{"]
+        body, _ = self.block({}, 1, budget)
+        lines.extend(body)
+        lines.append("    return x * n;")
+        lines.append("}")
+        self.user_functions.append(
+            {
+                "name": name,
+                "returns": parse_type("float$"),
+                "required": [parse_type("integer$"), parse_type("float$")],
+            }
+        )
+        return lines
+
+    def generate(self, statements):
+        lines = [f"// Synthetic {self.language} workload generated by generate_workload.py", ""]
+        remaining = statements
+
+        for _ in range(3):
+            function_budget = max(1, statements // 50)
+            lines.extend(self.user_function(function_budget))
+            lines.append("")
+            remaining -= function_budget
+
+        if self.language == "eidos":
+            scope = {"dictionary": "Dictionary", "frame": "DataFrame"}
+            lines.append("dictionary = Dictionary();")
+            lines.append("frame = DataFrame();")
+            body, _ = self.block(scope, 0, max(1, remaining))
+            lines.extend(body)
+            return "\n".join(lines) + "\n"
+
+        lines.extend(
+            [
+                "initialize() {",
+                "    initializeMutationRate(1e-7);",
+                '    initializeMutationType("m1", 0.5, "f", 0.0);',
+                '    initializeGenomicElementType("g1", m1, 1.0);',
+                "    initializeGenomicElement(g1, 0, 99999);",
+                "    initializeRecombinationRate(1e-8);",
+                "}",
+                "",
+                "1 early() {",
+                '    sim.addSubpop("p1", 500);',
+                "}",
+                "",
+            ]
+        )
+
+        globals_scope = {
+            "sim": "Species",
+            "community": "Community",
+            "p1": "Subpopulation",
+            "m1": "MutationType",
+            "g1": "GenomicElementType",
+        }
+        blocks = EVENT_NAMES + self.reference["callbacks"]
+        per_block = max(1, remaining // 20)
+        tick = 2
+        while remaining > 0:
+            kind = self.random.choice(blocks)
+            scope = dict(globals_scope)
+            if kind in CALLBACK_DECLARATIONS:
+                declaration, return_value = CALLBACK_DECLARATIONS[kind]
+                scope.update(CALLBACK_PSEUDO_PARAMETERS[kind])
+                lines.append(f"{tick} {declaration} {{")
+            else:
+                return_value = None
+                lines.append(f"{tick} {kind}() {{")
+            body, used = self.block(scope, 1, min(per_block, remaining))
+            lines.extend(body)
+            if return_value:
+                lines.append(f"    return {return_value};")
+            lines.append("}")
+            lines.append("")
+            remaining -= used
+            tick += self.random.randint(1, 10)
+
+        return "\n".join(lines).rstrip() + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--language", choices=["slim", "eidos"], default="slim")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--statements", type=int, default=1000, help="approximate script size")
+    parser.add_argument("--max-depth", type=int, default=3, help="maximum nesting of if/for blocks")
+    parser.add_argument(
+        "--call-density", type=float, default=0.5, help="probability of method calls (0-1)"
+    )
+    parser.add_argument("--chain-length", type=int, default=3, help="maximum member chain length")
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    args = parser.parse_args()
+
+    reference = load_reference(args.language)
+    generator = WorkloadGenerator(
+        reference,
+        args.language,
+        args.seed,
+        args.max_depth,
+        args.call_density,
+        max(1, args.chain_length),
+    )
+    script = generator.generate(args.statements)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(script)
+    else:
+        print(script, end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+import hashlib
+import json
+import os
+
+# Bump when the normalization below changes so existing cache files are ignored
+IR_VERSION = "1"
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".paragraph_cache")
+
+
+def tokenize_paragraphs(html):
+    """Turn an HTML reference page into a flat list of paragraph records.
+
+    Every record holds the paragraph's CSS classes, its text with <br> tags
+    turned into newlines and surrounding whitespace stripped, and the
+    character offset of its <p> tag in the HTML source.
+    """
+    # Imported here so cache hits never pay for loading BeautifulSoup
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+
+    for br in soup.find_all("br"):
+        br.replace_with("\n")
+
+    # html.parser reports positions as (line, column), counting lines on "\n" only
+    line_starts = [0]
+    for line in html.split("\n"):
+        line_starts.append(line_starts[-1] + len(line) + 1)
+
+    return [
+        {
+            "class": p.get("class", []),
+            "text": p.get_text().strip(),
+            "offset": line_starts[p.sourceline - 1] + p.sourcepos,
+        }
+        for p in soup.find_all("p")
+    ]
+
+
+def cache_path(html_path, html):
+    digest = hashlib.sha256(f"{IR_VERSION}\0{html}".encode("utf-8")).hexdigest()[:16]
+    stem = os.path.splitext(os.path.basename(html_path))[0]
+    return os.path.join(CACHE_DIR, f"{stem}.{digest}.jsonl")
+
+
+def load_paragraphs(html_path):
+    """Return the paragraph records for an HTML file, tokenizing it only when its content changed."""
+    with open(html_path, "r", encoding="utf-8") as file:
+        html = file.read()
+
+    path = cache_path(html_path, html)
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    paragraphs = tokenize_paragraphs(html)
+
+    # Drop cache files for earlier versions of this page before writing the new one
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    stem = os.path.splitext(os.path.basename(html_path))[0]
+    for name in os.listdir(CACHE_DIR):
+        if name.startswith(f"{stem}.") and name.endswith(".jsonl"):
+            os.remove(os.path.join(CACHE_DIR, name))
+
+    with open(path, "w", encoding="utf-8") as f:
+        for paragraph in paragraphs:
+            f.write(json.dumps(paragraph, ensure_ascii=False) + "\n")
+
+    return paragraphs
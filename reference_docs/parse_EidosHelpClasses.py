@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 
-from bs4 import BeautifulSoup
 import json
 import re
 
+from paragraphs import load_paragraphs
+
 
 def parse_signature(signature_text):
     """Parse a method signature into a clean format."""
@@ -20,9 +21,6 @@ def parse_property_type(property_line):
 
 
 def parse_slim_docs(html_path):
-    with open(html_path, "r", encoding="utf-8") as file:
-        soup = BeautifulSoup(file, "html.parser")
-
     result = {}
     current_class = None
     current_section = None  # 'methods' or 'properties'
@@ -30,14 +28,10 @@ def parse_slim_docs(html_path):
     found_constructor = False
     last_method = None
 
-    # First replace all br tags with newlines
-    for br in soup.find_all("br"):
-        br.replace_with("\n")
-
-    # Find all paragraphs
-    for p in soup.find_all("p"):
-        text = p.get_text().strip()
-        p_class = p.get("class", [""])[0]
+    # Paragraphs come with <br> tags already turned into newlines
+    for p in load_paragraphs(html_path):
+        text = p["text"]
+        p_class = (p["class"] or [""])[0]
 
         # Check for class headers (they typically have class names followed by "methods" or "properties")
         if p_class in ["p1", "p10"]:
@@ -1,27 +1,31 @@
 #!/usr/bin/env python3
 
-from bs4 import BeautifulSoup
 import json
 import re
 
+from paragraphs import load_paragraphs
 
-def parse_operator_docs(html_path):
-    with open(html_path, "r", encoding="utf-8") as file:
-        soup = BeautifulSoup(file, "html.parser")
 
+def parse_operator_docs(html_path):
+    """Parse operator sections; also return each section's category and operator symbols,
+    keyed like the result."""
     result = {}
+    sections = {}
     current_operator = None
 
     # Find all paragraphs
-    for p in soup.find_all("p"):
-        text = p.get_text().strip()
-        p_class = p.get("class", [])
+    for p in load_paragraphs(html_path):
+        text = p["text"]
+        p_class = p["class"]
 
         # Debugging: Print the text of each paragraph
         print(f"Processing paragraph: {text}")
 
         # Operator definitions are identified by "ITEM: "
         if "ITEM: " in text:
+            # A heading none of the patterns below recognize must not extend the previous section
+            current_operator = None
+
             # Extract operator name and symbols
             operator_match = re.match(r".*?M:\s+\d+\.\s+(.*operators?):\s+(.+)", text)
             if operator_match:
@@ -32,6 +36,10 @@ def parse_operator_docs(html_path):
                     "signature": operator_symbols,
                     "description": "",
                 }
+                sections[current_operator] = {
+                    "category": operator_name,
+                    "symbols": [symbol.strip() for symbol in operator_symbols.split(",")],
+                }
                 # Debugging: Print the matched operator
                 print(f"Matched operator: {current_operator}")
             else:
@@ -47,6 +55,12 @@ def parse_operator_docs(html_path):
                         "signature": operator_symbol,
                         "description": "",
                     }
+                    # The name reads like "Sequences: operator", or "Method calls: operator ()
+                    # and operator" when a section covers two operators
+                    sections[current_operator] = {
+                        "category": operator_name.split(":", 1)[0].strip(),
+                        "symbols": re.findall(r"operator\s+([^\w\s]+)", text),
+                    }
                     # Debugging: Print the matched operator
                     print(f"Matched operator: {current_operator}")
                 else:
@@ -66,6 +80,10 @@ def parse_operator_docs(html_path):
                             "signature": f"{operator_symbol1} and {operator_symbol2}",
                             "description": "",
                         }
+                        sections[current_operator] = {
+                            "category": operator_name,
+                            "symbols": [operator_symbol1, operator_symbol2],
+                        }
                         # Debugging: Print the matched operator
                         print(f"Matched operator: {current_operator}")
             continue
@@ -90,17 +108,99 @@ def parse_operator_docs(html_path):
     for operator_info in result.values():
         operator_info["description"] = operator_info["description"].strip()
 
-    return result
+    return result, sections
+
+
+def parse_precedence_levels(html_path):
+    """Read the precedence hierarchy listed under the grouping operator, highest first.
+
+    Each line looks like "+, -, ! unary plus, unary minus, logical (Boolean) negation
+    (right-associative)": leading symbols, then what they do.
+    """
+    levels = []
+    in_hierarchy = False
+
+    for p in load_paragraphs(html_path):
+        text = p["text"]
+        if "full precedence hierarchy" in text:
+            in_hierarchy = True
+            continue
+        if not in_hierarchy:
+            continue
+        if "p6" not in p["class"]:
+            break
+
+        symbols_match = re.match(r"^((?:[^\w\s]+,?\s+)+)(.*)$", text)
+        if not symbols_match:
+            print(f"Failed to match precedence level at offset {p['offset']}: {text}")
+            continue
+        symbols = [s.strip() for s in symbols_match.group(1).split(",") if s.strip()]
+        meaning = symbols_match.group(2)
+        levels.append(
+            {
+                "symbols": symbols,
+                "arity": 1 if "unary" in meaning else 2,
+                "associativity": "right" if "right-associative" in meaning else "left",
+            }
+        )
+
+    # The hierarchy omits the ternary conditional; its section describes it as "very low,
+    # but higher than operator =" in precedence, and right-associative
+    assignment_level = next(i for i, level in enumerate(levels) if "=" in level["symbols"])
+    levels.insert(
+        assignment_level, {"symbols": ["?"], "arity": 3, "associativity": "right"}
+    )
+
+    return levels
+
+
+def build_operator_table(sections, levels):
+    """Key operators by individual symbol. Each symbol lists its syntactic forms (arity,
+    precedence, associativity) and the documentation sections that describe it, each
+    given by its category and its key in eidos_operators.json."""
+    table = {}
+
+    for operator_key, section in sections.items():
+        for symbol in section["symbols"]:
+            entry = table.setdefault(symbol, {"forms": [], "sections": []})
+            entry["sections"].append({"category": section["category"], "key": operator_key})
+
+    # Higher precedence binds tighter; the first level listed binds tightest
+    for index, level in enumerate(levels):
+        for symbol in level["symbols"]:
+            entry = table.setdefault(symbol, {"forms": [], "sections": []})
+            entry["forms"].append(
+                {
+                    "arity": level["arity"],
+                    "precedence": len(levels) - index,
+                    "associativity": level["associativity"],
+                }
+            )
+
+    for symbol, entry in table.items():
+        if not entry["sections"]:
+            print(f"⚠️ Warning: Operator '{symbol}' has a precedence but no documentation section")
+        if not entry["forms"]:
+            print(f"⚠️ Warning: Operator '{symbol}' is missing from the precedence hierarchy")
+
+    return table
 
 
 def main():
     html_path = "EidosHelpOperators.html"
-    parsed_data = parse_operator_docs(html_path)
+    parsed_data, sections = parse_operator_docs(html_path)
 
     json_output_path = "../docs/eidos_operators.json"
     with open(json_output_path, "w", encoding="utf-8") as json_file:
         json.dump(parsed_data, json_file, indent=4)
 
+    levels = parse_precedence_levels(html_path)
+    operator_table = build_operator_table(sections, levels)
+
+    table_output_path = "../docs/eidos_operator_table.json"
+    with open(table_output_path, "w", encoding="utf-8") as json_file:
+        json.dump(operator_table, json_file, indent=4)
+
 
 if __name__ == "__main__":
     main()
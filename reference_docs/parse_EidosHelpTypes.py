@@ -1,19 +1,17 @@
-from bs4 import BeautifulSoup
 import json
 import re
 
+from paragraphs import load_paragraphs
 
-def parse_type_docs(html_path):
-    with open(html_path, "r", encoding="utf-8") as file:
-        soup = BeautifulSoup(file, "html.parser")
 
+def parse_type_docs(html_path):
     result = {}
     current_type = None
 
     # Find all paragraphs
-    for p in soup.find_all("p"):
-        text = p.get_text().strip()
-        p_class = p.get("class", [])
+    for p in load_paragraphs(html_path):
+        text = p["text"]
+        p_class = p["class"]
 
         # Type definitions are in p1
         if "p1" in p_class:
@@ -1,25 +1,19 @@
 #!/usr/bin/env python3
 
-from bs4 import BeautifulSoup
 import json
 import re
 
+from paragraphs import load_paragraphs
 
-def parse_callback_docs(html_path):
-    with open(html_path, "r", encoding="utf-8") as file:
-        soup = BeautifulSoup(file, "html.parser")
 
+def parse_callback_docs(html_path):
     result = {}
     current_callback = None
 
-    # First replace all br tags with newlines
-    for br in soup.find_all("br"):
-        br.replace_with("\n")
-
-    # Find all paragraphs
-    for p in soup.find_all("p"):
-        text = p.get_text().strip()
-        p_class = p.get("class", [])
+    # Paragraphs come with <br> tags already turned into newlines
+    for p in load_paragraphs(html_path):
+        text = p["text"]
+        p_class = p["class"]
 
         # Callback signatures are in p1
         if "p1" in p_class:
@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 
-from bs4 import BeautifulSoup
 import json
 import re
 
+from paragraphs import load_paragraphs
+
 
 def parse_signature(signature_text):
     """Parse a method signature into a clean format."""
@@ -20,9 +21,6 @@ def parse_property_type(property_line):
 
 
 def parse_slim_docs(html_path):
-    with open(html_path, "r", encoding="utf-8") as file:
-        soup = BeautifulSoup(file, "html.parser")
-
     result = {}
     current_class = None
     current_section = None  # 'methods' or 'properties'
@@ -30,11 +28,11 @@ def parse_slim_docs(html_path):
     found_constructor = False  # Added for constructor handling
 
     # Find all paragraphs
-    for p in soup.find_all("p"):
-        text = p.get_text().strip()
+    for p in load_paragraphs(html_path):
+        text = p["text"]
 
         # Check for class headers (they typically have class names followed by "methods" or "properties")
-        if p.get("class") in [["p1"], ["p10"]]:
+        if p["class"] in [["p1"], ["p10"]]:
             class_match = re.search(r"Class (\w+)", text)
             if class_match:
                 current_class = class_match.group(1)
@@ -49,7 +47,7 @@ def parse_slim_docs(html_path):
                 found_constructor = False  # Reset constructor flag
                 continue
 
-        if p.get("class") in [["p2"], ["p9"], ["p11"]]:
+        if p["class"] in [["p2"], ["p9"], ["p11"]]:
             if "properties" in text.lower():
                 found_constructor = False  # Reset constructor flag
                 current_section = "properties"
@@ -59,7 +57,7 @@ def parse_slim_docs(html_path):
             continue
 
         # Handle constructor
-        if current_class and p.get("class") in [["p3"], ["p5"]]:  # Added p5
+        if current_class and p["class"] in [["p3"], ["p5"]]:  # Added p5
             constructor_match = re.match(
                 r"\(object<" + current_class + r">\$\)" + current_class + r"\(.*\)",
                 text,
@@ -73,12 +71,12 @@ def parse_slim_docs(html_path):
                 continue
 
         # Handle constructor description - Added this section
-        elif found_constructor and p.get("class") in [["p4"], ["p6"]] and current_class:
+        elif found_constructor and p["class"] in [["p4"], ["p6"]] and current_class:
             result[current_class]["constructor"]["description"] += " " + text
             continue
 
         # Handle properties
-        if current_section == "properties" and p.get("class") in [["p3"], ["p5"]]:
+        if current_section == "properties" and p["class"] in [["p3"], ["p5"]]:
             property_match = re.match(
                 r"([\w\d_]+)\s*(?:<–>|&lt;–&gt;|<->|=>|\s*<span.*?>&lt;–&gt;</span>)?\s*\(([^)]+)\)",
                 text,
@@ -109,7 +107,7 @@ def parse_slim_docs(html_path):
         # Handle property descriptions
         elif (
             current_section == "properties"
-            and p.get("class") in [["p4"], ["p6"]]
+            and p["class"] in [["p4"], ["p6"]]
             and current_class
             and last_property
         ):
@@ -124,7 +122,7 @@ def parse_slim_docs(html_path):
                 )
 
         # Handle methods
-        elif current_section == "methods" and p.get("class") in [["p3"], ["p5"]]:
+        elif current_section == "methods" and p["class"] in [["p3"], ["p5"]]:
             method_match = re.match(
                 r"[–+\-]\s*[\xa0 ]*\((.*?)\)\s*([\w\d_]+)\s*\((.*)\)", text
             )
@@ -141,12 +139,14 @@ def parse_slim_docs(html_path):
                     f"✅ Found method: {method_name} in class {current_class}"
                 )  # Debugging
             else:
-                print(f"❌ No match for: {repr(text)}")  # Show the exact raw text
+                print(
+                    f"❌ No match at offset {p['offset']}: {repr(text)}"
+                )  # Show the exact raw text
 
         # Handle method descriptions
         elif (
             current_section == "methods"
-            and p.get("class") in [["p4"], ["p6"]]
+            and p["class"] in [["p4"], ["p6"]]
             and current_class
         ):
             # Add description to the last added method
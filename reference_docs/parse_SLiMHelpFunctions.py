@@ -1,26 +1,20 @@
 #!/usr/bin/env python3
 
-from bs4 import BeautifulSoup
 import json
 import re
 
+from paragraphs import load_paragraphs
 
-def parse_function_docs(html_path):
-    with open(html_path, "r", encoding="utf-8") as file:
-        soup = BeautifulSoup(file, "html.parser")
 
+def parse_function_docs(html_path):
     result = {}
     current_section = None
     current_function = None
 
-    # First replace all br tags with newlines
-    for br in soup.find_all("br"):
-        br.replace_with("\n")
-
-    # Find all paragraphs
-    for p in soup.find_all("p"):
-        text = p.get_text().strip()
-        p_class = p.get("class", [])
+    # Paragraphs come with <br> tags already turned into newlines
+    for p in load_paragraphs(html_path):
+        text = p["text"]
+        p_class = p["class"]
 
         print(f"Found paragraph with class {p_class}: {text[:50]}...")  # Debug print
 
@@ -34,7 +28,7 @@ def parse_function_docs(html_path):
                 current_function = None
                 print(f"Found section: {current_section}")  # Debug print
             else:
-                print(f"Failed to match section in: {text}")  # Debug print
+                print(f"Failed to match section at offset {p['offset']}: {text}")  # Debug print
             continue
 
         # Function signatures are in p2 and p4
@@ -63,7 +57,7 @@ def parse_function_docs(html_path):
                             )  # Debug print
                     else:
                         print(
-                            f"Failed to match function in: {signature}"
+                            f"Failed to match function at offset {p['offset']}: {signature}"
                         )  # Debug print
             continue
 
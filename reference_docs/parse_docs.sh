@@ -1,6 +1,7 @@
 #!/bin/bash
 
 # Parse all documentation files (outputs directly to ../docs/)
+# Each HTML file is tokenized once into .paragraph_cache/ and reused until it changes
 python parse_EidosHelpClasses.py
 python parse_EidosHelpFunctions.py
 python parse_EidosHelpOperators.py
@@ -9,4 +10,10 @@ python parse_SLiMHelpClasses.py
 python parse_SLiMHelpFunctions.py
 python parse_SLiMHelpCallbacks.py
 
+# Build derived lookup structures from the parsed docs
+python build_class_members.py
+python build_fuzzy_index.py
+python build_completion_items.py
+python build_grammar.py
+
 echo "✅ All documentation parsed and written to docs/ folder"
\ No newline at end of file
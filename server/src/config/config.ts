@@ -429,6 +429,13 @@ export const ERROR_MESSAGES = {
         `${typeName} ${id} may not be defined in the focal species`,
 } as const;
 
+// Patterns for recovering identifiers from the messages above
+export const ERROR_MESSAGE_PATTERNS = {
+    METHOD_NOT_EXISTS: /^Method '(\w+)' does not exist on (\w+)/,
+    PROPERTY_NOT_EXISTS: /^Property '(\w+)' does not exist on (\w+)/,
+    FUNCTION_NOT_FOUND: /^Function '(\w+)' not found/,
+} as const;
+
 export const TYPE_NAMES_FOR_ERRORS = {
     MUTATION_TYPE: 'Mutation type',
     GENOMIC_ELEMENT_TYPE: 'Genomic element type',
@@ -461,6 +468,15 @@ export const FOLDING_RANGE_PATTERNS = {
     LOOP_BLOCK: /^(for|while|do)\s*(\(|{)/,
 } as const;
 
+// ============================================================================
+// Fuzzy matching
+// ============================================================================
+
+export const FUZZY_MATCH_CONFIG = {
+    MAX_DISTANCE: 2,
+    MAX_SUGGESTIONS: 3,
+} as const;
+
 // ============================================================================
 // Caching
 // ============================================================================
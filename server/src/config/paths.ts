@@ -12,3 +12,7 @@ export const EIDOS_CLASSES_PATH = path.join(__dirname, levelsUp, 'docs', 'eidos_
 export const SLIM_CALLBACKS_PATH = path.join(__dirname, levelsUp, 'docs', 'slim_callbacks.json');
 export const EIDOS_TYPES_PATH = path.join(__dirname, levelsUp, 'docs', 'eidos_types.json');
 export const EIDOS_OPERATORS_PATH = path.join(__dirname, levelsUp, 'docs', 'eidos_operators.json');
+export const EIDOS_OPERATOR_TABLE_PATH = path.join(__dirname, levelsUp, 'docs', 'eidos_operator_table.json');
+export const CLASS_MEMBERS_PATH = path.join(__dirname, levelsUp, 'docs', 'class_members.json');
+export const FUZZY_INDEX_PATH = path.join(__dirname, levelsUp, 'docs', 'fuzzy_index.json');
+export const COMPLETION_ITEMS_PATH = path.join(__dirname, levelsUp, 'docs', 'completion_items.json');
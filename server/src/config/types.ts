@@ -4,7 +4,7 @@ import { TextDocument } from 'vscode-languageserver-textdocument';
 import { DocumentationService } from '../services/documentation-service';
 import { CompletionService } from '../services/completion-service';
 import { ValidationService } from '../services/validation-service';
-import { Diagnostic, FoldingRangeKind, Range } from 'vscode-languageserver';
+import { CompletionItem, Diagnostic, FoldingRangeKind, Range } from 'vscode-languageserver';
 
 // ============================================================================
 // Language mode
@@ -30,12 +30,14 @@ export interface FunctionInfo {
 export interface MethodInfo {
     signature: string;
     description: string;
+    definedIn?: string; // Class that declares the method, when inherited
 }
 
 // Documentation for a class property: its type and description
 export interface PropertyInfo {
     type: string;
     description: string;
+    definedIn?: string; // Class that declares the property, when inherited
 }
 
 // Documentation for a class constructor: its signature and description
@@ -44,12 +46,13 @@ export interface ConstructorInfo {
     description: string;
 }
 
-// Complete documentation for a class: constructor, methods, properties, and source language
+// Complete documentation for a class: constructor, superclass, methods, properties, and source language
 export interface ClassInfo {
     constructor?: {
         signature?: string;
         description?: string;
     };
+    superclass?: string | null;
     methods?: { [key: string]: MethodInfo };
     properties?: { [key: string]: PropertyInfo };
     source?: LanguageMode;
@@ -80,6 +83,44 @@ export interface OperatorInfo {
     description: string;
 }
 
+// One syntactic form of an operator symbol, e.g. unary or binary '-'
+export interface OperatorForm {
+    arity: number;
+    precedence: number; // Higher binds tighter
+    associativity: 'left' | 'right';
+}
+
+// Operator table entry keyed by symbol: its forms and the documentation sections
+// describing it (key is the section key in eidos_operators.json)
+export interface OperatorTableEntry {
+    forms: OperatorForm[];
+    sections: { category: string; key: string }[];
+}
+
+// Serialized BK-tree node: an identifier and its children keyed by edit distance
+export interface BKTreeNode {
+    word: string;
+    children: { [distance: string]: BKTreeNode };
+}
+
+// Prebuilt fuzzy lookup index: global identifiers per language mode and members per class
+export interface FuzzyIndex {
+    globals: Partial<Record<LanguageMode, BKTreeNode>>;
+    members: Record<string, BKTreeNode>;
+}
+
+// A fuzzy lookup hit: the known identifier and its edit distance from the query
+export interface FuzzyMatch {
+    word: string;
+    distance: number;
+}
+
+// Prebuilt completion items: global scope per language mode and members per class
+export interface CompletionItemIndex {
+    globals: Partial<Record<LanguageMode, CompletionItem[]>>;
+    members: Record<string, CompletionItem[]>;
+}
+
 // Tick cycle descriptions for Wright-Fisher (WF) and non-Wright-Fisher (nonWF) models
 export interface TickCycleInfo {
     wf: string;
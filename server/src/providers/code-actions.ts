@@ -4,15 +4,19 @@ import {
     CodeActionParams,
     Diagnostic,
     WorkspaceEdit,
-    TextEdit
+    TextEdit,
+    Range
 } from 'vscode-languageserver';
 import { TextDocument } from 'vscode-languageserver-textdocument';
-import { LanguageServerContext } from '../config/types';
-import { ERROR_MESSAGES } from '../config/config';
+import { LanguageServerContext, BKTreeNode } from '../config/types';
+import { ERROR_MESSAGES, ERROR_MESSAGE_PATTERNS, FUZZY_MATCH_CONFIG } from '../config/config';
+import { DocumentationService } from '../services/documentation-service';
+import { searchBKTree } from '../utils/fuzzy-match';
+import { getFileType } from '../utils/file-type';
 
 // Register code action provider
 export function registerCodeActionProvider(context: LanguageServerContext): void {
-    const { connection, documents } = context;
+    const { connection, documents, documentationService } = context;
 
     connection.onCodeAction((params: CodeActionParams): CodeAction[] => {
         const document = documents.get(params.textDocument.uri);
@@ -21,7 +25,11 @@ export function registerCodeActionProvider(context: LanguageServerContext): void
         const codeActions: CodeAction[] = [];
         
         for (const diagnostic of params.context.diagnostics) {
-            const actions = createCodeActionsForDiagnostic(diagnostic, document);
+            const actions = createCodeActionsForDiagnostic(
+                diagnostic,
+                document,
+                documentationService
+            );
             codeActions.push(...actions);
         }
 
@@ -36,7 +44,8 @@ export function registerCodeActionProvider(context: LanguageServerContext): void
 // Define all possible code actions for each diagnostic that can be fixed
 function createCodeActionsForDiagnostic(
     diagnostic: Diagnostic,
-    document: TextDocument
+    document: TextDocument,
+    documentationService: DocumentationService
 ): CodeAction[] {
     const actions: CodeAction[] = [];
     const message = diagnostic.message;
@@ -62,6 +71,8 @@ function createCodeActionsForDiagnostic(
         actions.push(createAddClosingBracketAction(diagnostic, uri));
     }
 
+    actions.push(...createDidYouMeanActions(diagnostic, document, documentationService));
+
     return actions;
 }
 
@@ -209,6 +220,66 @@ function createAddClosingBracketAction(diagnostic: Diagnostic, uri: string): Cod
     };
 }
 
+// Suggest the closest known identifiers for unknown functions, methods and properties
+function createDidYouMeanActions(
+    diagnostic: Diagnostic,
+    document: TextDocument,
+    documentationService: DocumentationService
+): CodeAction[] {
+    const message = diagnostic.message;
+    let unknownName: string;
+    let candidates: BKTreeNode | null;
+
+    const memberMatch =
+        message.match(ERROR_MESSAGE_PATTERNS.METHOD_NOT_EXISTS) ||
+        message.match(ERROR_MESSAGE_PATTERNS.PROPERTY_NOT_EXISTS);
+    const functionMatch = message.match(ERROR_MESSAGE_PATTERNS.FUNCTION_NOT_FOUND);
+
+    if (memberMatch) {
+        unknownName = memberMatch[1];
+        candidates = documentationService.getMemberFuzzyIndex(memberMatch[2]);
+    } else if (functionMatch) {
+        unknownName = functionMatch[1];
+        candidates = documentationService.getGlobalFuzzyIndex(getFileType(document));
+    } else {
+        return [];
+    }
+
+    const suggestions = searchBKTree(candidates, unknownName, FUZZY_MATCH_CONFIG.MAX_DISTANCE)
+        .filter((match) => match.word !== unknownName)
+        .slice(0, FUZZY_MATCH_CONFIG.MAX_SUGGESTIONS);
+    if (suggestions.length === 0) return [];
+
+    const range = getIdentifierRange(diagnostic, document, unknownName);
+
+    return suggestions.map((suggestion, index) => ({
+        title: `Did you mean '${suggestion.word}'?`,
+        kind: CodeActionKind.QuickFix,
+        diagnostics: [diagnostic],
+        edit: {
+            changes: {
+                [document.uri]: [{ range, newText: suggestion.word }]
+            }
+        },
+        isPreferred: index === 0
+    }));
+}
+
+// Narrow the diagnostic range to the unknown identifier when it covers more than the name
+function getIdentifierRange(diagnostic: Diagnostic, document: TextDocument, name: string): Range {
+    const { start, end } = diagnostic.range;
+    if (start.line !== end.line) return diagnostic.range;
+
+    const text = document.getText(diagnostic.range);
+    const offset = text.search(new RegExp(`\\b${name}\\b`));
+    if (offset < 0 || text === name) return diagnostic.range;
+
+    return {
+        start: { line: start.line, character: start.character + offset },
+        end: { line: start.line, character: start.character + offset + name.length }
+    };
+}
+
 function createBatchActions(diagnostics: Diagnostic[], document: TextDocument): CodeAction[] {
     const actions: CodeAction[] = [];
     
@@ -1,7 +1,7 @@
 import { HoverParams } from 'vscode-languageserver';
 import { getOperatorAtPosition, getWordAndContextAtPosition } from '../utils/positions';
 import { trackInstanceDefinitions } from '../utils/instance';
-import { createOperatorMarkdown } from '../utils/markdown';
+import { createOperatorMarkdown, createOperatorTableMarkdown } from '../utils/markdown';
 import { LanguageServerContext } from '../config/types';
 import { getHoverForWord } from '../utils/hover-resolvers';
 import { getFileType } from '../utils/file-type';
@@ -27,6 +27,19 @@ export function registerHoverProvider(context: LanguageServerContext): void {
 
         // Check for operators first
         const operator = getOperatorAtPosition(text, position);
+        const operatorEntry = operator ? documentationService.getOperatorTableEntry(operator) : null;
+        if (operator && operatorEntry) {
+            return {
+                contents: {
+                    kind: 'markdown',
+                    value: createOperatorTableMarkdown(
+                        operator,
+                        operatorEntry,
+                        documentationService.getOperatorSections()
+                    ),
+                },
+            };
+        }
         if (operator && operatorsData[operator]) {
             return {
                 contents: {
@@ -18,18 +18,11 @@ import {
     createUserFunctionMarkdown,
 } from '../utils/markdown';
 import {
-    FunctionInfo,
-    MethodInfo,
-    PropertyInfo,
-    CallbackInfo,
-    OperatorInfo,
-    ConstructorInfo,
     LanguageMode,
     TrackingState,
     WordInfo,
     UserFunctionInfo,
 } from '../config/types';
-import { cleanSignature, cleanTypeNames } from '../utils/text-processing';
 import { getFileType } from '../utils/file-type';
 import { resolveExpressionType } from '../utils/type-manager';
 import { documentCache } from './document-cache';
@@ -96,6 +89,9 @@ export class CompletionService {
         }
 
         const data = item.data as any;
+
+        // Documentation items are shared between requests, so resolve onto a copy
+        item = { ...item };
         
         // Handle different completion types
         switch (data.type) {
@@ -239,58 +235,18 @@ export class CompletionService {
     ): void {
         if (!className) return;
 
-        const classesData = this.documentationService.getClasses(fileType);
-        const classInfo = classesData[className];
-
-        if (!classInfo) return;
-
-        // Add methods
-        if (classInfo.methods) {
-            for (const [methodName, methodInfo] of Object.entries(classInfo.methods)) {
-                completions.push(
-                    this.createMethodCompletion(className, methodName, methodInfo)
-                );
-            }
-        }
+        const memberItems = this.documentationService.getMemberCompletionItems(className, fileType);
+        if (!memberItems) return;
 
-        // Add properties
-        if (classInfo.properties) {
-            for (const [propName, propInfo] of Object.entries(classInfo.properties)) {
-                completions.push(
-                    this.createPropertyCompletion(className, propName, propInfo)
-                );
-            }
-        }
+        completions.push(...memberItems);
     }
 
     private addGlobalCompletions(
         completions: CompletionItem[],
         fileType: LanguageMode
     ): void {
-        const functionsData = this.documentationService.getFunctions(fileType);
-        const classConstructors = this.documentationService.getClassConstructors(fileType);
-        const callbacksData = this.documentationService.getCallbacks(fileType);
-        const operatorsData = this.documentationService.getOperators();
-
-        // Add functions
-        for (const [funcName, funcInfo] of Object.entries(functionsData)) {
-            completions.push(this.createFunctionCompletion(funcName, funcInfo));
-        }
-
-        // Add class constructors
-        for (const [className, constructorInfo] of Object.entries(classConstructors)) {
-            completions.push(this.createConstructorCompletion(className, constructorInfo));
-        }
-
-        // Add callbacks (SLiM-only)
-        for (const [callbackName, callbackInfo] of Object.entries(callbacksData)) {
-            completions.push(this.createCallbackCompletion(callbackName, callbackInfo));
-        }
-
-        // Add operators
-        for (const [operatorName, operatorInfo] of Object.entries(operatorsData)) {
-            completions.push(this.createOperatorCompletion(operatorName, operatorInfo));
-        }
+        // Functions, class constructors, callbacks (SLiM-only) and operators
+        completions.push(...this.documentationService.getGlobalCompletionItems(fileType));
     }
 
     private addUserDefinedCompletions(
@@ -407,111 +363,6 @@ export class CompletionService {
         }
     }
 
-    private createMethodCompletion(
-        className: string,
-        methodName: string,
-        methodInfo: MethodInfo
-    ): CompletionItem {
-        const cleanedSignature = cleanSignature(methodInfo.signature);
-        return {
-            label: methodName,
-            kind: CompletionItemKind.Method,
-            detail: cleanedSignature,
-            data: {
-                type: 'method',
-                className,
-                methodName,
-            },
-        };
-    }
-
-    private createPropertyCompletion(
-        className: string,
-        propertyName: string,
-        propertyInfo: PropertyInfo
-    ): CompletionItem {
-        const cleanedType = cleanTypeNames(propertyInfo.type);
-        return {
-            label: propertyName,
-            kind: CompletionItemKind.Property,
-            detail: `Type: ${cleanedType}`,
-            data: {
-                type: 'property',
-                className,
-                propertyName,
-            },
-        };
-    }
-
-    private createFunctionCompletion(
-        functionName: string,
-        functionInfo: FunctionInfo
-    ): CompletionItem {
-        const signature = functionInfo.signature || functionInfo.signatures?.[0] || '';
-        const cleanedSignature = cleanSignature(signature);
-        return {
-            label: functionName,
-            kind: CompletionItemKind.Function,
-            detail: cleanedSignature,
-            sortText: `2_${functionName}`,
-            data: {
-                type: 'function',
-                functionName,
-            },
-        };
-    }
-
-    private createCallbackCompletion(
-        callbackName: string,
-        callbackInfo: CallbackInfo
-    ): CompletionItem {
-        const cleanedSignature = cleanSignature(callbackInfo.signature);
-        return {
-            label: callbackName,
-            kind: CompletionItemKind.Function,
-            detail: cleanedSignature,
-            sortText: `2_${callbackName}`,
-            data: {
-                type: 'callback',
-                callbackName,
-            },
-        };
-    }
-
-    private createConstructorCompletion(
-        className: string,
-        constructorInfo: ConstructorInfo
-    ): CompletionItem {
-        const cleanedSignature = cleanSignature(constructorInfo.signature);
-        return {
-            label: className,
-            kind: CompletionItemKind.Class,
-            detail: cleanedSignature,
-            sortText: `2_${className}`,
-            data: {
-                type: 'constructor',
-                className,
-            },
-        };
-    }
-    
-    private createOperatorCompletion(
-        operatorName: string,
-        operatorInfo: OperatorInfo
-    ): CompletionItem {
-        const cleanedSignature = cleanSignature(operatorInfo.signature);
-        return {
-            label: operatorName,
-            kind: CompletionItemKind.Operator,
-            detail: cleanedSignature,
-            sortText: `3_${operatorName}`, 
-            data: {
-                type: 'operator',
-                operatorName,
-            },
-        };
-    }
-
     private createUserFunctionCompletion(
         funcName: string,
         funcInfo: UserFunctionInfo
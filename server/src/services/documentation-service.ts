@@ -1,4 +1,5 @@
 import * as fs from 'fs';
+import { CompletionItem } from 'vscode-languageserver/node';
 
 import {
     SLIM_FUNCTIONS_PATH,
@@ -8,6 +9,10 @@ import {
     SLIM_CALLBACKS_PATH,
     EIDOS_TYPES_PATH,
     EIDOS_OPERATORS_PATH,
+    EIDOS_OPERATOR_TABLE_PATH,
+    CLASS_MEMBERS_PATH,
+    FUZZY_INDEX_PATH,
+    COMPLETION_ITEMS_PATH,
 } from '../config/paths';
 import {
     TEXT_PROCESSING_PATTERNS,
@@ -18,12 +23,18 @@ import {
     CallbackInfo,
     TypeInfo,
     OperatorInfo,
+    OperatorTableEntry,
     ConstructorInfo,
     LanguageMode,
+    BKTreeNode,
+    FuzzyIndex,
+    CompletionItemIndex,
 } from '../config/types';
 import { log, logErrorWithStack } from '../utils/logger';
 import { cleanSignature } from '../utils/text-processing';
 import { isSourceAvailableInMode } from '../utils/file-type';
+import { buildBKTree } from '../utils/fuzzy-match';
+import { buildCompletionItemIndex } from '../utils/completion-items';
 
 // Helper function to extract constructor information from class data
 function buildClassConstructors(
@@ -50,7 +61,11 @@ export class DocumentationService {
     private callbacksData: Record<string, CallbackInfo> = {};
     private typesData: Record<string, TypeInfo> = {};
     private operatorsData: Record<string, OperatorInfo> = {};
+    private operatorSections: Record<string, OperatorInfo> = {};
+    private operatorTable: Record<string, OperatorTableEntry> = {};
     private classConstructors: Record<string, ConstructorInfo> = {};
+    private fuzzyIndex: FuzzyIndex = { globals: {}, members: {} };
+    private completionItems: CompletionItemIndex = { globals: {}, members: {} };
 
     constructor() {
         this.loadDocumentation();
@@ -66,11 +81,8 @@ export class DocumentationService {
                 `Loaded Eidos functions: ${Object.keys(this.functionsData).length} total functions`
             );
 
-            this.loadClassData(SLIM_CLASSES_PATH, 'slim', this.classesData);
-            log(`Loaded SLiM classes: ${Object.keys(this.classesData).length} classes`);
-
-            this.loadClassData(EIDOS_CLASSES_PATH, 'eidos', this.classesData);
-            log(`Loaded Eidos classes: ${Object.keys(this.classesData).length} total classes`);
+            this.classesData = this.loadClassMembers(CLASS_MEMBERS_PATH);
+            log(`Loaded classes: ${Object.keys(this.classesData).length} total classes`);
 
             this.loadCallbackData(SLIM_CALLBACKS_PATH, this.callbacksData);
             log(`Loaded SLiM callbacks: ${Object.keys(this.callbacksData).length} callbacks`);
@@ -86,11 +98,24 @@ export class DocumentationService {
                 log(`Loaded Eidos types: ${Object.keys(this.typesData).length} types`);
             }
 
-            this.loadOperatorData(EIDOS_OPERATORS_PATH, this.operatorsData);
+            this.loadOperatorData(EIDOS_OPERATORS_PATH, this.operatorsData, this.operatorSections);
             log(`Loaded Eidos operators: ${Object.keys(this.operatorsData).length} operators`);
 
+            this.operatorTable =
+                this.loadJsonFile<Record<string, OperatorTableEntry>>(EIDOS_OPERATOR_TABLE_PATH) ||
+                {};
+            log(`Loaded operator table: ${Object.keys(this.operatorTable).length} symbols`);
+
             this.classConstructors = this.extractClassConstructors(this.classesData);
 
+            this.fuzzyIndex = this.loadFuzzyIndex(FUZZY_INDEX_PATH);
+            log(`Loaded fuzzy index: ${Object.keys(this.fuzzyIndex.members).length} classes`);
+
+            this.completionItems = this.loadCompletionItems(COMPLETION_ITEMS_PATH);
+            log(
+                `Loaded completion items: ${Object.keys(this.completionItems.members).length} classes`
+            );
+
             log('Documentation loaded successfully');
         } catch (error) {
             logErrorWithStack(error, 'Error loading documentation');
@@ -129,6 +154,16 @@ export class DocumentationService {
         return this.operatorsData;
     }
 
+    // Forms (arity, precedence, associativity) and documentation sections for one symbol
+    public getOperatorTableEntry(symbol: string): OperatorTableEntry | null {
+        return this.operatorTable[symbol] ?? null;
+    }
+
+    // Operator documentation keyed by section, as referenced by OperatorTableEntry.sections
+    public getOperatorSections(): Record<string, OperatorInfo> {
+        return this.operatorSections;
+    }
+
     public getClassConstructors(mode?: LanguageMode): Record<string, ConstructorInfo> {
         if (!mode) {
             return this.classConstructors;
@@ -144,6 +179,30 @@ export class DocumentationService {
         return result;
     }
 
+    public getGlobalFuzzyIndex(mode: LanguageMode): BKTreeNode | null {
+        return this.fuzzyIndex.globals[mode] ?? null;
+    }
+
+    public getMemberFuzzyIndex(className: string): BKTreeNode | null {
+        return this.fuzzyIndex.members[className] ?? null;
+    }
+
+    // Prebuilt items are shared between requests and must not be mutated
+    public getGlobalCompletionItems(mode: LanguageMode): readonly CompletionItem[] {
+        return this.completionItems.globals[mode] ?? [];
+    }
+
+    public getMemberCompletionItems(
+        className: string,
+        mode: LanguageMode
+    ): readonly CompletionItem[] | null {
+        const classInfo = this.classesData[className];
+        if (!classInfo || !isSourceAvailableInMode(classInfo.source, mode)) {
+            return null;
+        }
+        return this.completionItems.members[className] ?? null;
+    }
+
     private filterByLanguageMode<T extends { source?: LanguageMode }>(
         data: Record<string, T>,
         mode: LanguageMode
@@ -270,6 +329,21 @@ export class DocumentationService {
         }
     }
 
+    // Flattened member tables include inherited members, so each lookup is a single access.
+    // Without them, fall back to the per-file classes (own members only).
+    private loadClassMembers(filePath: string): Record<string, ClassInfo> {
+        const data = this.loadJsonFile<Record<string, ClassInfo>>(filePath);
+        if (data) {
+            return data;
+        }
+
+        log('Class member tables not found, loading classes without inherited members');
+        const classesData: Record<string, ClassInfo> = {};
+        this.loadClassData(SLIM_CLASSES_PATH, 'slim', classesData);
+        this.loadClassData(EIDOS_CLASSES_PATH, 'eidos', classesData);
+        return classesData;
+    }
+
     private loadCallbackData(filePath: string, target: Record<string, CallbackInfo>): void {
         const data =
             this.loadJsonFile<Record<string, { signature: string; description: string }>>(
@@ -283,7 +357,11 @@ export class DocumentationService {
         }
     }
 
-    private loadOperatorData(filePath: string, target: Record<string, OperatorInfo>): void {
+    private loadOperatorData(
+        filePath: string,
+        target: Record<string, OperatorInfo>,
+        sections: Record<string, OperatorInfo>
+    ): void {
         const data =
             this.loadJsonFile<Record<string, { signature?: string; description: string }>>(
                 filePath
@@ -292,7 +370,8 @@ export class DocumentationService {
 
         for (const [key, value] of Object.entries(data)) {
             if (!value || typeof value !== 'object') continue;
-            
+            sections[key] = this.transformOperatorData(key, value);
+
             const signature = value.signature || '';
             const extractedKeys = signature
                 .split(',')
@@ -308,6 +387,51 @@ export class DocumentationService {
         }
     }
 
+    private loadFuzzyIndex(filePath: string): FuzzyIndex {
+        const data = this.loadJsonFile<FuzzyIndex>(filePath);
+        if (data && data.globals && data.members) {
+            return data;
+        }
+
+        // Prebuilt index missing (e.g. docs regenerated without build_fuzzy_index.py):
+        // fall back to building it from the loaded documentation
+        log('Building fuzzy index from loaded documentation');
+        return this.buildFuzzyIndex();
+    }
+
+    private loadCompletionItems(filePath: string): CompletionItemIndex {
+        const data = this.loadJsonFile<CompletionItemIndex>(filePath);
+        if (data && data.globals && data.members) {
+            return data;
+        }
+
+        log('Building completion items from loaded documentation');
+        return buildCompletionItemIndex(this);
+    }
+
+    private buildFuzzyIndex(): FuzzyIndex {
+        const index: FuzzyIndex = { globals: {}, members: {} };
+
+        for (const mode of ['eidos', 'slim'] as LanguageMode[]) {
+            const names = [
+                ...Object.keys(this.getFunctions(mode)),
+                ...Object.keys(this.getClasses(mode)),
+            ];
+            const tree = buildBKTree(names);
+            if (tree) index.globals[mode] = tree;
+        }
+
+        for (const [className, classInfo] of Object.entries(this.classesData)) {
+            const tree = buildBKTree([
+                ...Object.keys(classInfo.methods || {}),
+                ...Object.keys(classInfo.properties || {}),
+            ]);
+            if (tree) index.members[className] = tree;
+        }
+
+        return index;
+    }
+
     private extractClassConstructors(
         classesData: Record<string, ClassInfo>
     ): Record<string, ConstructorInfo> {
@@ -2,13 +2,13 @@ import { Diagnostic } from 'vscode-languageserver';
 import { TextDocument } from 'vscode-languageserver-textdocument';
 import { DocumentationService } from './documentation-service';
 import { validateStructure } from '../validation/structure';
+import { validateFunctionCalls, validateMethodOrPropertyCall } from '../validation/identifiers';
+import { trackInstanceDefinitions } from '../utils/instance';
 import { getFileType } from '../utils/file-type';
 import { documentCache } from './document-cache';
 
 export class ValidationService {
-    constructor(private documentationService: DocumentationService) {
-        // documentationService will be used when additional validation features are integrated
-    }
+    constructor(private documentationService: DocumentationService) {}
 
     // Gets the documentation service
     public getDocumentationService(): DocumentationService {
@@ -32,15 +32,24 @@ export class ValidationService {
         const structureDiagnostics = validateStructure(lines, fileType);
         diagnostics.push(...structureDiagnostics);
 
-        // Future validation modules will be called here following this pattern:
-        // e.g. for method/property call validation,
-        //
-        //    const methodPropertyDiagnostics = validateMethodOrPropertyCall(
-        //        lines,
-        //        trackingState,
-        //        this.documentationService.getClasses(fileType)
-        //    );
-        //    diagnostics.push(...methodPropertyDiagnostics);
+        // Check identifiers against the documentation for this language mode, so
+        // unknown names reach the "Did you mean" code actions
+        const trackingState = trackInstanceDefinitions(textDocument);
+        const classes = this.documentationService.getClasses(fileType);
+
+        const functionDiagnostics = validateFunctionCalls(
+            lines,
+            this.documentationService.getFunctions(fileType),
+            classes
+        );
+        diagnostics.push(...functionDiagnostics);
+
+        const methodPropertyDiagnostics = validateMethodOrPropertyCall(
+            lines,
+            trackingState,
+            classes
+        );
+        diagnostics.push(...methodPropertyDiagnostics);
 
         // Cache the results using the unified document cache
         documentCache.setDiagnostics(textDocument, diagnostics);
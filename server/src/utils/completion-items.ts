@@ -0,0 +1,177 @@
+import { CompletionItem, CompletionItemKind } from 'vscode-languageserver/node';
+import type { DocumentationService } from '../services/documentation-service';
+import {
+    FunctionInfo,
+    MethodInfo,
+    PropertyInfo,
+    CallbackInfo,
+    OperatorInfo,
+    ConstructorInfo,
+    CompletionItemIndex,
+    LanguageMode,
+} from '../config/types';
+import { cleanSignature, cleanTypeNames } from './text-processing';
+
+// Builders for documentation completion items. reference_docs/build_completion_items.py
+// emits the same items ahead of time; keep the two in sync.
+
+export function createMethodCompletion(
+    className: string,
+    methodName: string,
+    methodInfo: MethodInfo
+): CompletionItem {
+    const cleanedSignature = cleanSignature(methodInfo.signature);
+    return {
+        label: methodName,
+        kind: CompletionItemKind.Method,
+        detail: cleanedSignature,
+        data: {
+            type: 'method',
+            className,
+            methodName,
+        },
+    };
+}
+
+export function createPropertyCompletion(
+    className: string,
+    propertyName: string,
+    propertyInfo: PropertyInfo
+): CompletionItem {
+    const cleanedType = cleanTypeNames(propertyInfo.type);
+    return {
+        label: propertyName,
+        kind: CompletionItemKind.Property,
+        detail: `Type: ${cleanedType}`,
+        data: {
+            type: 'property',
+            className,
+            propertyName,
+        },
+    };
+}
+
+export function createFunctionCompletion(
+    functionName: string,
+    functionInfo: FunctionInfo
+): CompletionItem {
+    const signature = functionInfo.signature || functionInfo.signatures?.[0] || '';
+    const cleanedSignature = cleanSignature(signature);
+    return {
+        label: functionName,
+        kind: CompletionItemKind.Function,
+        detail: cleanedSignature,
+        sortText: `2_${functionName}`,
+        data: {
+            type: 'function',
+            functionName,
+        },
+    };
+}
+
+export function createCallbackCompletion(
+    callbackName: string,
+    callbackInfo: CallbackInfo
+): CompletionItem {
+    const cleanedSignature = cleanSignature(callbackInfo.signature);
+    return {
+        label: callbackName,
+        kind: CompletionItemKind.Function,
+        detail: cleanedSignature,
+        sortText: `2_${callbackName}`,
+        data: {
+            type: 'callback',
+            callbackName,
+        },
+    };
+}
+
+export function createConstructorCompletion(
+    className: string,
+    constructorInfo: ConstructorInfo
+): CompletionItem {
+    const cleanedSignature = cleanSignature(constructorInfo.signature);
+    return {
+        label: className,
+        kind: CompletionItemKind.Class,
+        detail: cleanedSignature,
+        sortText: `2_${className}`,
+        data: {
+            type: 'constructor',
+            className,
+        },
+    };
+}
+
+export function createOperatorCompletion(
+    operatorName: string,
+    operatorInfo: OperatorInfo
+): CompletionItem {
+    const cleanedSignature = cleanSignature(operatorInfo.signature);
+    return {
+        label: operatorName,
+        kind: CompletionItemKind.Operator,
+        detail: cleanedSignature,
+        sortText: `3_${operatorName}`,
+        data: {
+            type: 'operator',
+            operatorName,
+        },
+    };
+}
+
+// Global scope items for one language mode: functions, constructors, callbacks, operators
+function buildGlobalCompletionItems(
+    documentationService: DocumentationService,
+    mode: LanguageMode
+): CompletionItem[] {
+    const items: CompletionItem[] = [];
+
+    for (const [funcName, funcInfo] of Object.entries(documentationService.getFunctions(mode))) {
+        items.push(createFunctionCompletion(funcName, funcInfo));
+    }
+
+    const classConstructors = documentationService.getClassConstructors(mode);
+    for (const [className, constructorInfo] of Object.entries(classConstructors)) {
+        items.push(createConstructorCompletion(className, constructorInfo));
+    }
+
+    for (const [callbackName, callbackInfo] of Object.entries(
+        documentationService.getCallbacks(mode)
+    )) {
+        items.push(createCallbackCompletion(callbackName, callbackInfo));
+    }
+
+    for (const [operatorName, operatorInfo] of Object.entries(
+        documentationService.getOperators()
+    )) {
+        items.push(createOperatorCompletion(operatorName, operatorInfo));
+    }
+
+    return items;
+}
+
+export function buildCompletionItemIndex(
+    documentationService: DocumentationService
+): CompletionItemIndex {
+    const index: CompletionItemIndex = {
+        globals: {
+            eidos: buildGlobalCompletionItems(documentationService, 'eidos'),
+            slim: buildGlobalCompletionItems(documentationService, 'slim'),
+        },
+        members: {},
+    };
+
+    for (const [className, classInfo] of Object.entries(documentationService.getClasses())) {
+        const items: CompletionItem[] = [];
+        for (const [methodName, methodInfo] of Object.entries(classInfo.methods || {})) {
+            items.push(createMethodCompletion(className, methodName, methodInfo));
+        }
+        for (const [propName, propInfo] of Object.entries(classInfo.properties || {})) {
+            items.push(createPropertyCompletion(className, propName, propInfo));
+        }
+        index.members[className] = items;
+    }
+
+    return index;
+}
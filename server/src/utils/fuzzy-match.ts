@@ -0,0 +1,75 @@
+import { BKTreeNode, FuzzyMatch } from '../config/types';
+
+export function levenshteinDistance(a: string, b: string): number {
+    if (a === b) return 0;
+    if (!a.length) return b.length;
+    if (!b.length) return a.length;
+
+    let previous = Array.from({ length: b.length + 1 }, (_, j) => j);
+    for (let i = 1; i <= a.length; i++) {
+        const current = [i];
+        for (let j = 1; j <= b.length; j++) {
+            const cost = a[i - 1] === b[j - 1] ? 0 : 1;
+            current.push(Math.min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost));
+        }
+        previous = current;
+    }
+    return previous[b.length];
+}
+
+// Builds a BK-tree in the same shape as the one serialized by reference_docs/build_fuzzy_index.py
+export function buildBKTree(words: Iterable<string>): BKTreeNode | null {
+    let root: BKTreeNode | null = null;
+
+    for (const word of [...new Set(words)].sort()) {
+        if (!root) {
+            root = { word, children: {} };
+            continue;
+        }
+
+        let node = root;
+        for (;;) {
+            const distance = String(levenshteinDistance(word, node.word));
+            const child: BKTreeNode | undefined = node.children[distance];
+            if (!child) {
+                node.children[distance] = { word, children: {} };
+                break;
+            }
+            node = child;
+        }
+    }
+
+    return root;
+}
+
+// Returns all words within maxDistance of the query, closest first.
+// The triangle inequality lets us skip every subtree outside [d - max, d + max].
+export function searchBKTree(
+    root: BKTreeNode | null | undefined,
+    query: string,
+    maxDistance: number
+): FuzzyMatch[] {
+    if (!root) return [];
+
+    const matches: FuzzyMatch[] = [];
+    const stack: BKTreeNode[] = [root];
+
+    while (stack.length > 0) {
+        const node = stack.pop()!;
+        const distance = levenshteinDistance(query, node.word);
+        if (distance <= maxDistance) {
+            matches.push({ word: node.word, distance });
+        }
+
+        const low = distance - maxDistance;
+        const high = distance + maxDistance;
+        for (const [key, child] of Object.entries(node.children)) {
+            const childDistance = Number(key);
+            if (childDistance >= low && childDistance <= high) {
+                stack.push(child);
+            }
+        }
+    }
+
+    return matches.sort((a, b) => a.distance - b.distance || a.word.localeCompare(b.word));
+}
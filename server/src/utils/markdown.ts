@@ -7,6 +7,7 @@ import {
     CallbackInfo,
     TypeInfo,
     OperatorInfo,
+    OperatorTableEntry,
     ConstructorInfo,
     LanguageMode,
     UserFunctionInfo,
@@ -29,6 +30,10 @@ function createTickCycleSection(tickCycleKey: string): string {
         : '';
 }
 
+function createInheritedSection(className: string, definedIn?: string): string {
+    return definedIn && definedIn !== className ? `**Inherited from:** \`${definedIn}\`\n\n` : '';
+}
+
 export function createMethodMarkdown(
     className: string,
     methodName: string,
@@ -39,7 +44,7 @@ export function createMethodMarkdown(
     const returnType = returnTypeMatch ? cleanTypeNames(returnTypeMatch[1]) : 'void';
     const signatureWithoutReturnType = methodInfo.signature.replace(/^\([^)]+\)\s*/, '');
     
-    return `**${className}.${methodName}** (method)\n\n**Return Type:** \`${returnType}\`\n\n\`\`\`slim\n${cleanSignature(signatureWithoutReturnType)}\n\`\`\`\n\n${cleanDocumentationText(methodInfo.description)}`;
+    return `**${className}.${methodName}** (method)\n\n${createInheritedSection(className, methodInfo.definedIn)}**Return Type:** \`${returnType}\`\n\n\`\`\`slim\n${cleanSignature(signatureWithoutReturnType)}\n\`\`\`\n\n${cleanDocumentationText(methodInfo.description)}`;
 }
 
 export function createPropertyMarkdown(
@@ -47,7 +52,7 @@ export function createPropertyMarkdown(
     propertyName: string,
     propertyInfo: PropertyInfo
 ): string {
-    return `**${className}.${propertyName}** (property)\n\n**Type:** \`${cleanTypeNames(propertyInfo.type)}\`\n\n${cleanDocumentationText(propertyInfo.description)}`;
+    return `**${className}.${propertyName}** (property)\n\n${createInheritedSection(className, propertyInfo.definedIn)}**Type:** \`${cleanTypeNames(propertyInfo.type)}\`\n\n${cleanDocumentationText(propertyInfo.description)}`;
 }
 
 export function createPropertySourceMarkdown(
@@ -85,6 +90,30 @@ export function createOperatorMarkdown(operator: string, operatorInfo: OperatorI
     return `**${operator}** (operator)\n\n${cleanDocumentationText(operatorInfo.description)}`;
 }
 
+const ARITY_NAMES: Record<number, string> = { 1: 'unary', 2: 'binary', 3: 'ternary' };
+
+export function createOperatorTableMarkdown(
+    operator: string,
+    entry: OperatorTableEntry,
+    sections: Record<string, OperatorInfo>
+): string {
+    const forms = entry.forms
+        .map(
+            (form) =>
+                `- ${ARITY_NAMES[form.arity] ?? `${form.arity}-ary`}: precedence ${form.precedence}, ${form.associativity}-associative`
+        )
+        .join('\n');
+    const descriptions = entry.sections
+        .filter((section) => sections[section.key])
+        .map(
+            (section) =>
+                `**${section.category}**\n\n${cleanDocumentationText(sections[section.key].description)}`
+        )
+        .join('\n\n');
+
+    return `**${operator}** (operator)\n\n${forms ? `${forms}\n\n` : ''}${descriptions}`;
+}
+
 export function createInstanceMarkdown(
     instanceName: string, 
     instanceClass: string,
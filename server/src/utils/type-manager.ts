@@ -1,7 +1,7 @@
 import { INSTANCE_TO_CLASS_MAP, CLASS_NAMES, TYPE_PATTERNS, 
     TYPE_INFERENCE_PATTERNS } from '../config/config';
     import { ClassInfo } from '../config/types';
-import { EIDOS_CLASSES_PATH, SLIM_CLASSES_PATH } from '../config/paths';
+import { CLASS_MEMBERS_PATH, EIDOS_CLASSES_PATH, SLIM_CLASSES_PATH } from '../config/paths';
 import { vectorToSingleton, parseDocumentationType, 
     formatDocumentationType } from './vector-detector';
 import * as fs from 'fs';
@@ -195,6 +195,14 @@ function loadClassDocumentation(): Record<string, ClassInfo> {
         return classDocumentationCache;
     }
 
+    // Flattened tables already contain inherited members (e.g. Dictionary's getValue on Individual)
+    try {
+        classDocumentationCache = JSON.parse(fs.readFileSync(CLASS_MEMBERS_PATH, 'utf8')) as Record<string, ClassInfo>;
+        return classDocumentationCache;
+    } catch (error) {
+        // Fall back to the per-file classes below
+    }
+
     classDocumentationCache = {};
 
     const slimClassesPath = SLIM_CLASSES_PATH;
@@ -244,15 +252,9 @@ function parseMethodReturnType(signature: string): string | null {
 function inferTypeFromProperty(baseType: string, propertyName: string): string | null {
     const singletonType = vectorToSingleton(baseType);
 
-    const classes = loadClassDocumentation();
-
-    for (const [className, classInfo] of Object.entries(classes)) {
-        if (className === singletonType && classInfo.properties) {
-            const propertyInfo = classInfo.properties[propertyName];
-            if (propertyInfo && propertyInfo.type) {
-                return parsePropertyType(propertyInfo.type);
-            }
-        }
+    const propertyInfo = loadClassDocumentation()[singletonType]?.properties?.[propertyName];
+    if (propertyInfo && propertyInfo.type) {
+        return parsePropertyType(propertyInfo.type);
     }
 
     switch (singletonType) {
@@ -290,15 +292,9 @@ function parsePropertyType(typeString: string): string | null {
 function inferTypeFromMethodCall(baseType: string, methodName: string): string | null {
     const singletonType = vectorToSingleton(baseType);
 
-    const classes = loadClassDocumentation();
-
-    for (const [className, classInfo] of Object.entries(classes)) {
-        if (className === singletonType && classInfo.methods) {
-            const methodInfo = classInfo.methods[methodName];
-            if (methodInfo && methodInfo.signature) {
-                return parseMethodReturnType(methodInfo.signature);
-            }
-        }
+    const methodInfo = loadClassDocumentation()[singletonType]?.methods?.[methodName];
+    if (methodInfo && methodInfo.signature) {
+        return parseMethodReturnType(methodInfo.signature);
     }
 
     switch (singletonType) {
@@ -0,0 +1,163 @@
+import { Diagnostic, DiagnosticSeverity } from 'vscode-languageserver';
+import { CALLBACK_NAMES, CLASS_NAMES, ERROR_MESSAGES } from '../config/config';
+import { ClassInfo, FunctionInfo, TrackingState } from '../config/types';
+import { resolveClassName } from '../utils/type-manager';
+import { vectorToSingleton } from '../utils/vector-detector';
+import { createDiagnostic } from '../utils/diagnostics';
+
+// Keywords that may be followed by '(' without being function calls
+const CALL_LIKE_KEYWORDS = new Set([
+    'if', 'else', 'do', 'while', 'for', 'in', 'next', 'break', 'return', 'function',
+]);
+
+// An identifier directly followed by '(' that is not itself a member access
+const CALL_PATTERN = /(?<![\w.])([A-Za-z_]\w*)(?=\s*\()/g;
+
+// A plain identifier receiver followed by its first member, e.g. "p1.individuals"
+const MEMBER_ACCESS_PATTERN = /(?<![\w.])([A-Za-z_]\w*)\s*\.\s*([A-Za-z_]\w*)(\s*\()?/g;
+
+// The name in a user function declaration, e.g. "function (float)mean2(float x)"
+const FUNCTION_DECLARATION_PATTERN = /\bfunction\s*\([^)]*\)\s*([A-Za-z_]\w*)/g;
+
+// Blanks out string literals and comments while keeping every character's column,
+// so diagnostics can be placed on the original text. Strings and block comments
+// may span lines.
+function maskStringsAndComments(lines: string[]): string[] {
+    let stringChar: string | null = null;
+    let inBlockComment = false;
+
+    return lines.map((line) => {
+        const masked = line.split('');
+
+        for (let i = 0; i < line.length; i++) {
+            const char = line[i];
+
+            if (inBlockComment) {
+                masked[i] = ' ';
+                if (char === '*' && line[i + 1] === '/') {
+                    masked[i + 1] = ' ';
+                    i++;
+                    inBlockComment = false;
+                }
+            } else if (stringChar) {
+                masked[i] = ' ';
+                if (char === '\\') {
+                    if (i + 1 < line.length) masked[i + 1] = ' ';
+                    i++;
+                } else if (char === stringChar) {
+                    stringChar = null;
+                }
+            } else if (char === '"' || char === "'") {
+                masked[i] = ' ';
+                stringChar = char;
+            } else if (char === '/' && line[i + 1] === '/') {
+                masked.fill(' ', i);
+                break;
+            } else if (char === '/' && line[i + 1] === '*') {
+                masked[i] = ' ';
+                masked[i + 1] = ' ';
+                i++;
+                inBlockComment = true;
+            }
+        }
+
+        return masked.join('');
+    });
+}
+
+// Flags calls to names that are neither documented functions, class constructors,
+// callbacks nor functions declared in the document
+export function validateFunctionCalls(
+    lines: string[],
+    functions: Record<string, FunctionInfo>,
+    classes: Record<string, ClassInfo>
+): Diagnostic[] {
+    const diagnostics: Diagnostic[] = [];
+    const code = maskStringsAndComments(lines);
+
+    // Declarations may follow their first call or span several lines, so collect them up front
+    const knownNames = new Set<string>([...CALL_LIKE_KEYWORDS, ...CALLBACK_NAMES]);
+    for (const match of code.join('\n').matchAll(FUNCTION_DECLARATION_PATTERN)) {
+        knownNames.add(match[1]);
+    }
+
+    code.forEach((line, lineIndex) => {
+        for (const match of line.matchAll(CALL_PATTERN)) {
+            const name = match[1];
+            const start = match.index ?? 0;
+
+            if (knownNames.has(name) || functions[name] || classes[name]) {
+                continue;
+            }
+
+            diagnostics.push(
+                createDiagnostic(
+                    DiagnosticSeverity.Warning,
+                    lineIndex,
+                    start,
+                    start + name.length,
+                    ERROR_MESSAGES.FUNCTION_NOT_FOUND(name)
+                )
+            );
+        }
+    });
+
+    return diagnostics;
+}
+
+// Class of a receiver whose type does not depend on inference: model objects
+// (sim, community, p1, m1, ...), conventional names such as ind, and declared species.
+// Variables typed from their assignments are skipped because the tracked type is
+// document-wide and may belong to a different assignment than the one in scope.
+function resolveReceiverClass(receiver: string, trackingState: TrackingState): string | null {
+    if (trackingState.definedSpecies.has(receiver)) {
+        return CLASS_NAMES.SPECIES;
+    }
+
+    const className = resolveClassName(receiver);
+    const tracked = trackingState.instanceDefinitions[receiver];
+    if (!className || (tracked && vectorToSingleton(tracked) !== className)) {
+        return null;
+    }
+    return className;
+}
+
+// Flags the first member accessed on a receiver whose class is known, e.g. "p1.indviduals".
+// Later links of a chain are not checked because their receiver type is not tracked here.
+export function validateMethodOrPropertyCall(
+    lines: string[],
+    trackingState: TrackingState,
+    classes: Record<string, ClassInfo>
+): Diagnostic[] {
+    const diagnostics: Diagnostic[] = [];
+
+    maskStringsAndComments(lines).forEach((code, lineIndex) => {
+        for (const match of code.matchAll(MEMBER_ACCESS_PATTERN)) {
+            const [fullMatch, receiver, memberName, callParen] = match;
+            const className = resolveReceiverClass(receiver, trackingState);
+            const classInfo = className ? classes[className] : undefined;
+            if (!className || !classInfo) continue;
+
+            const isMethod = callParen !== undefined;
+            const exists = isMethod
+                ? Boolean(classInfo.methods?.[memberName])
+                : Boolean(classInfo.properties?.[memberName] || classInfo.methods?.[memberName]);
+            if (exists) continue;
+
+            const start = (match.index ?? 0) + fullMatch.indexOf(memberName, receiver.length);
+            diagnostics.push(
+                createDiagnostic(
+                    DiagnosticSeverity.Warning,
+                    lineIndex,
+                    start,
+                    start + memberName.length,
+                    isMethod
+                        ? ERROR_MESSAGES.METHOD_NOT_EXISTS(memberName, className)
+                        : ERROR_MESSAGES.PROPERTY_NOT_EXISTS(memberName, className)
+                )
+            );
+        }
+    });
+
+    return diagnostics;
+}
@@ -1,4 +1,6 @@
 import { describe, it, expect, beforeEach } from 'vitest';
+import * as fs from 'fs';
+import * as path from 'path';
 import { TextDocument } from 'vscode-languageserver-textdocument';
 import { DocumentationService } from '../../src/services/documentation-service';
 import { CompletionService } from '../../src/services/completion-service';
@@ -7,6 +9,15 @@ import { setLoggerSilent } from '../../src/utils/logger';
 import { documentCache } from '../../src/services/document-cache';
 import { trackInstanceDefinitions } from '../../src/utils/instance';
 import { validateStructure } from '../../src/validation/structure';
+import { formatSLiMCode } from '../../src/providers/formatting';
+
+// Seeded synthetic models from reference_docs/generate_workload.py (see test-sims/README.md)
+const GENERATED_WORKLOADS_DIR = path.join(__dirname, '../../../test-sims/generated');
+
+function loadGeneratedWorkload(fileName: string): TextDocument {
+    const content = fs.readFileSync(path.join(GENERATED_WORKLOADS_DIR, fileName), 'utf8');
+    return TextDocument.create(`file:///${fileName}`, path.extname(fileName).slice(1), 1, content);
+}
 
 describe('Performance Tests', () => {
     let documentationService: DocumentationService;
@@ -442,6 +453,75 @@ describe('Performance Tests', () => {
         });
     });
 
+    describe('Generated Workloads', () => {
+        it('should track instances in a generated SLiM model efficiently', () => {
+            const document = loadGeneratedWorkload('workload.slim');
+
+            const startTime = performance.now();
+            const trackingState = trackInstanceDefinitions(document);
+            const endTime = performance.now();
+
+            expect(trackingState.definedSubpopulations.has('p1')).toBe(true);
+            expect(trackingState.userFunctions.size).toBe(3);
+            expect(endTime - startTime).toBeLessThan(2000);
+        });
+
+        it('should validate generated models without structural errors', () => {
+            for (const fileName of ['workload.slim', 'workload.eidos']) {
+                const document = loadGeneratedWorkload(fileName);
+                const documentLines = document.getText().split('\n');
+
+                const startTime = performance.now();
+                const diagnostics = validateStructure(
+                    documentLines,
+                    fileName.endsWith('.eidos') ? 'eidos' : 'slim'
+                );
+                const endTime = performance.now();
+
+                expect(diagnostics).toEqual([]);
+                expect(endTime - startTime).toBeLessThan(500);
+            }
+        });
+
+        it('should validate generated models without unknown identifiers', async () => {
+            for (const fileName of ['workload.slim', 'workload.eidos']) {
+                const document = loadGeneratedWorkload(fileName);
+
+                const startTime = performance.now();
+                const diagnostics = await validationService.validate(document);
+                const endTime = performance.now();
+
+                expect(diagnostics).toEqual([]);
+                expect(endTime - startTime).toBeLessThan(2000);
+            }
+        });
+
+        it('should format a generated SLiM model efficiently', () => {
+            const text = loadGeneratedWorkload('workload.slim').getText();
+
+            const startTime = performance.now();
+            const formatted = formatSLiMCode(text, { tabSize: 4, insertSpaces: true });
+            const endTime = performance.now();
+
+            expect(formatted.trimEnd()).toBe(text.trimEnd());
+            expect(endTime - startTime).toBeLessThan(1000);
+        });
+
+        it('should complete member chains in a generated SLiM model efficiently', () => {
+            const document = loadGeneratedWorkload('workload.slim');
+            const lines = document.getText().split('\n');
+            const line = lines.findIndex((text) => /^\s+v\d+ = sim\./.test(text));
+            const character = lines[line].indexOf('sim.') + 'sim.'.length;
+
+            const startTime = performance.now();
+            const completions = completionService.getCompletions(document, { line, character });
+            const endTime = performance.now();
+
+            expect(Array.isArray(completions) && completions.length).toBeGreaterThan(0);
+            expect(endTime - startTime).toBeLessThan(1000);
+        });
+    });
+
     describe('Stress Tests', () => {
         it('should handle extreme document size (20000+ lines)', () => {
             const lines: string[] = [];
@@ -410,6 +410,146 @@ describe('Code Actions Provider', () => {
         });
     });
 
+    describe('Did You Mean Code Actions', () => {
+        it('should suggest the closest method name for an unknown method', () => {
+            const content = `p1.sampleIndividuls(10);`;
+            const document = TextDocument.create('file:///test.slim', 'slim', 1, content);
+            mockDocuments.get = () => document;
+
+            const diagnostic = createDiagnostic(
+                DiagnosticSeverity.Error,
+                0,
+                3,
+                19,
+                ERROR_MESSAGES.METHOD_NOT_EXISTS('sampleIndividuls', 'Subpopulation')
+            );
+
+            const result = codeActionHandler({
+                textDocument: { uri: 'file:///test.slim' },
+                range: diagnostic.range,
+                context: { diagnostics: [diagnostic] },
+            });
+
+            const action = result.find((a: any) => a.title === "Did you mean 'sampleIndividuals'?");
+            expect(action).toBeDefined();
+            expect(action.kind).toBe(CodeActionKind.QuickFix);
+            expect(action.isPreferred).toBe(true);
+            expect(action.edit.changes['file:///test.slim'][0].newText).toBe('sampleIndividuals');
+            expect(action.edit.changes['file:///test.slim'][0].range).toEqual(diagnostic.range);
+        });
+
+        it('should narrow the edit to the identifier inside a wider diagnostic range', () => {
+            const content = `x = p1.indviduals;`;
+            const document = TextDocument.create('file:///test.slim', 'slim', 1, content);
+            mockDocuments.get = () => document;
+
+            const diagnostic = createDiagnostic(
+                DiagnosticSeverity.Error,
+                0,
+                0,
+                18,
+                ERROR_MESSAGES.PROPERTY_NOT_EXISTS('indviduals', 'Subpopulation')
+            );
+
+            const result = codeActionHandler({
+                textDocument: { uri: 'file:///test.slim' },
+                range: diagnostic.range,
+                context: { diagnostics: [diagnostic] },
+            });
+
+            const action = result.find((a: any) => a.title === "Did you mean 'individuals'?");
+            expect(action).toBeDefined();
+            expect(action.edit.changes['file:///test.slim'][0].range).toEqual({
+                start: { line: 0, character: 7 },
+                end: { line: 0, character: 17 },
+            });
+        });
+
+        it('should suggest function names available in the current language mode', () => {
+            const content = `initializeMutationTyp("m1", 0.5, "f", 0.0);`;
+            const diagnostic = createDiagnostic(
+                DiagnosticSeverity.Error,
+                0,
+                0,
+                21,
+                ERROR_MESSAGES.FUNCTION_NOT_FOUND('initializeMutationTyp')
+            );
+
+            const slimDocument = TextDocument.create('file:///test.slim', 'slim', 1, content);
+            mockDocuments.get = () => slimDocument;
+            const slimResult = codeActionHandler({
+                textDocument: { uri: 'file:///test.slim' },
+                range: diagnostic.range,
+                context: { diagnostics: [diagnostic] },
+            });
+            expect(
+                slimResult.find((a: any) => a.title === "Did you mean 'initializeMutationType'?")
+            ).toBeDefined();
+
+            const eidosDocument = TextDocument.create('file:///test.eidos', 'eidos', 1, content);
+            mockDocuments.get = () => eidosDocument;
+            const eidosResult = codeActionHandler({
+                textDocument: { uri: 'file:///test.eidos' },
+                range: diagnostic.range,
+                context: { diagnostics: [diagnostic] },
+            });
+            expect(
+                eidosResult.find((a: any) => a.title === "Did you mean 'initializeMutationType'?")
+            ).toBeUndefined();
+        });
+
+        it('should suggest fixes for unknown names reported by validation', async () => {
+            const content = ['1 early() {', '    x = summ(1:3);', '    inds = p1.individualz;', '}'].join('\n');
+            const document = TextDocument.create('file:///test.slim', 'slim', 1, content);
+            mockDocuments.get = () => document;
+
+            const diagnostics = await validationService.validate(document);
+            expect(diagnostics.map(d => d.message)).toEqual([
+                ERROR_MESSAGES.FUNCTION_NOT_FOUND('summ'),
+                ERROR_MESSAGES.PROPERTY_NOT_EXISTS('individualz', 'Subpopulation'),
+            ]);
+
+            const result = codeActionHandler({
+                textDocument: { uri: 'file:///test.slim' },
+                range: { start: { line: 0, character: 0 }, end: { line: 3, character: 1 } },
+                context: { diagnostics },
+            });
+
+            const sumAction = result.find((a: any) => a.title === "Did you mean 'sum'?");
+            expect(sumAction.edit.changes['file:///test.slim'][0]).toEqual({
+                range: { start: { line: 1, character: 8 }, end: { line: 1, character: 12 } },
+                newText: 'sum',
+            });
+
+            const propertyAction = result.find((a: any) => a.title === "Did you mean 'individuals'?");
+            expect(propertyAction.edit.changes['file:///test.slim'][0]).toEqual({
+                range: { start: { line: 2, character: 14 }, end: { line: 2, character: 25 } },
+                newText: 'individuals',
+            });
+        });
+
+        it('should not suggest anything for names far from any known identifier', () => {
+            const document = TextDocument.create('file:///test.slim', 'slim', 1, 'zzzzzzzz();');
+            mockDocuments.get = () => document;
+
+            const diagnostic = createDiagnostic(
+                DiagnosticSeverity.Error,
+                0,
+                0,
+                8,
+                ERROR_MESSAGES.FUNCTION_NOT_FOUND('zzzzzzzz')
+            );
+
+            const result = codeActionHandler({
+                textDocument: { uri: 'file:///test.slim' },
+                range: diagnostic.range,
+                context: { diagnostics: [diagnostic] },
+            });
+
+            expect(result).toEqual([]);
+        });
+    });
+
     describe('Multiple Diagnostic Types', () => {
         it('should provide actions for multiple different diagnostic types', () => {
             const content = `x = 5\ny = "unclosed`;
@@ -5,6 +5,7 @@ import { DocumentationService } from '../../src/services/documentation-service';
 import { CompletionService } from '../../src/services/completion-service';
 import { setLoggerSilent } from '../../src/utils/logger';
 import { documentCache } from '../../src/services/document-cache';
+import { buildCompletionItemIndex } from '../../src/utils/completion-items';
 
 describe('Completion Service', () => {
     let documentationService: DocumentationService;
@@ -385,4 +386,54 @@ describe('Completion Service', () => {
             }
         });
     });
+
+    describe('Prebuilt Completion Items', () => {
+        it('should match the items built from the loaded documentation', () => {
+            const built = buildCompletionItemIndex(documentationService);
+
+            expect(documentationService.getGlobalCompletionItems('eidos')).toEqual(built.globals.eidos);
+            expect(documentationService.getGlobalCompletionItems('slim')).toEqual(built.globals.slim);
+            for (const [className, items] of Object.entries(built.members)) {
+                expect(documentationService.getMemberCompletionItems(className, 'slim')).toEqual(items);
+            }
+        });
+
+        it('should only expose Eidos items in Eidos mode', () => {
+            const labels = documentationService.getGlobalCompletionItems('eidos').map(item => item.label);
+
+            expect(labels).toContain('sum');
+            expect(labels).toContain('Dictionary');
+            expect(labels).not.toContain('initializeMutationRate');
+            expect(labels).not.toContain('Individual');
+            expect(documentationService.getMemberCompletionItems('Individual', 'eidos')).toBeNull();
+            expect(documentationService.getMemberCompletionItems('Individual', 'slim')).not.toBeNull();
+        });
+
+        it('should include inherited members in class member items', () => {
+            const labels = documentationService
+                .getMemberCompletionItems('Subpopulation', 'slim')
+                ?.map(item => item.label);
+
+            // Declared on Dictionary and Object respectively
+            expect(labels).toContain('serialize');
+            expect(labels).toContain('str');
+
+            const classInfo = documentationService.getClasses()['Subpopulation'];
+            expect(classInfo.superclass).toBe('Dictionary');
+            expect(classInfo.methods?.['serialize']?.definedIn).toBe('Dictionary');
+            expect(classInfo.methods?.['setValue']?.definedIn).toBe('Subpopulation');
+        });
+
+        it('should not mutate shared items when resolving', () => {
+            const sumItem = documentationService
+                .getGlobalCompletionItems('slim')
+                .find(item => item.label === 'sum');
+
+            expect(sumItem).toBeDefined();
+            const resolved = completionService.resolveCompletion(sumItem!);
+
+            expect(resolved.documentation).toBeDefined();
+            expect(sumItem!.documentation).toBeUndefined();
+        });
+    });
 });
@@ -0,0 +1,110 @@
+import { describe, it, expect, beforeAll } from 'vitest';
+import * as fs from 'fs';
+import * as path from 'path';
+import { DocumentationService } from '../../src/services/documentation-service';
+import { setLoggerSilent } from '../../src/utils/logger';
+
+const GRAMMAR_PATH = path.join(__dirname, '../../../syntaxes/slim.tmLanguage.json');
+
+interface GrammarPattern {
+    name?: string;
+    match?: string;
+    begin?: string;
+    include?: string;
+}
+
+describe('TextMate Grammar', () => {
+    let documentationService: DocumentationService;
+    let repository: Record<string, GrammarPattern>;
+    let patterns: GrammarPattern[];
+
+    beforeAll(() => {
+        setLoggerSilent(true);
+        documentationService = new DocumentationService();
+
+        const grammar = JSON.parse(fs.readFileSync(GRAMMAR_PATH, 'utf8'));
+        repository = grammar.repository;
+        patterns = grammar.patterns;
+    });
+
+    // Anchor the generated pattern so it must consume the whole candidate
+    function matchesExactly(key: string, candidate: string): boolean {
+        return new RegExp(`^(?:${repository[key].match})$`).test(candidate);
+    }
+
+    // Scope of the first top-level pattern matching at the start of the text, as TextMate picks it
+    function scopeAt(text: string): string | undefined {
+        for (const pattern of patterns) {
+            const resolved = pattern.include ? repository[pattern.include.slice(1)] : pattern;
+            const source = resolved.match ?? resolved.begin;
+            if (source && new RegExp(source, 'y').test(text)) {
+                return resolved.name;
+            }
+        }
+        return undefined;
+    }
+
+    it('should include every generated scope before the generic function pattern', () => {
+        const order = patterns.map(p => p.include ?? p.name);
+        const genericIndex = order.indexOf('entity.name.function.slim');
+
+        for (const key of ['builtin-functions', 'builtin-classes', 'builtin-callbacks', 'builtin-types']) {
+            expect(repository[key]?.match).toBeDefined();
+            expect(order.indexOf(`#${key}`)).toBeGreaterThanOrEqual(0);
+            expect(order.indexOf(`#${key}`)).toBeLessThan(genericIndex);
+        }
+    });
+
+    it('should match every documented function and no other name', () => {
+        const functionNames = Object.keys(documentationService.getFunctions());
+        const regex = new RegExp(`^${repository['builtin-functions'].match}`);
+        const known = new Set(functionNames);
+
+        for (const name of functionNames) {
+            expect(regex.test(`${name}(`), name).toBe(true);
+
+            // Prefixes and extensions of builtin names are user identifiers
+            for (const candidate of [name.slice(0, -1), `${name}_`]) {
+                if (candidate && !known.has(candidate)) {
+                    expect(regex.test(`${candidate}(`), candidate).toBe(false);
+                }
+            }
+        }
+    });
+
+    it('should match every documented class and type', () => {
+        for (const className of Object.keys(documentationService.getClasses())) {
+            expect(matchesExactly('builtin-classes', className), className).toBe(true);
+        }
+        for (const typeName of Object.keys(documentationService.getTypes())) {
+            expect(matchesExactly('builtin-types', typeName), typeName).toBe(true);
+        }
+        expect(matchesExactly('builtin-classes', 'Individuals')).toBe(false);
+    });
+
+    it('should match callbacks only when followed by a parameter list', () => {
+        const regex = new RegExp(repository['builtin-callbacks'].match);
+
+        expect(regex.test('late()')).toBe(true);
+        expect(regex.test('mutationEffect(m1)')).toBe(true);
+        expect(regex.test('late = 1;')).toBe(false);
+    });
+
+    it('should give builtin calls their generated scopes before any hand-written pattern', () => {
+        expect(scopeAt('initialize() {')).toBe('support.function.callback.slim');
+        expect(scopeAt('initializeMutationRate(1e-7);')).toBe('support.function.builtin.slim');
+        expect(scopeAt('sum(x);')).toBe('support.function.builtin.slim');
+        expect(scopeAt('sim.addSubpop("p1", 10);')).toBe('keyword.other.slim');
+    });
+
+    it('should not match method calls that share a builtin name', () => {
+        const functionRegex = new RegExp(repository['builtin-functions'].match);
+        const callbackRegex = new RegExp(repository['builtin-callbacks'].match);
+
+        expect(functionRegex.test('size(x)')).toBe(true);
+        for (const call of ['x.size()', 'm.length()', 'x.str()', 'ind.usage()', 'x.matrix()']) {
+            expect(functionRegex.test(call), call).toBe(false);
+        }
+        expect(callbackRegex.test('sim.early()')).toBe(false);
+    });
+});
@@ -0,0 +1,134 @@
+import { describe, it, expect, beforeAll } from 'vitest';
+import { TextDocument } from 'vscode-languageserver-textdocument';
+import { DiagnosticSeverity } from 'vscode-languageserver';
+import { validateFunctionCalls, validateMethodOrPropertyCall } from '../../src/validation/identifiers';
+import { DocumentationService } from '../../src/services/documentation-service';
+import { trackInstanceDefinitions } from '../../src/utils/instance';
+import { documentCache } from '../../src/services/document-cache';
+import { setLoggerSilent } from '../../src/utils/logger';
+import { ERROR_MESSAGES } from '../../src/config/config';
+
+describe('Identifier Validation', () => {
+    let documentationService: DocumentationService;
+
+    beforeAll(() => {
+        setLoggerSilent(true);
+        documentationService = new DocumentationService();
+    });
+
+    function validateFunctions(lines: string[], mode: 'slim' | 'eidos' = 'slim') {
+        return validateFunctionCalls(
+            lines,
+            documentationService.getFunctions(mode),
+            documentationService.getClasses(mode)
+        );
+    }
+
+    function validateMembers(lines: string[]) {
+        documentCache.clear();
+        const document = TextDocument.create('file:///test.slim', 'slim', 1, lines.join('\n'));
+        return validateMethodOrPropertyCall(
+            lines,
+            trackInstanceDefinitions(document),
+            documentationService.getClasses('slim')
+        );
+    }
+
+    describe('Function Calls', () => {
+        it('should flag unknown functions on the function name', () => {
+            const diagnostics = validateFunctions(['x = summ(1:3);']);
+
+            expect(diagnostics).toHaveLength(1);
+            expect(diagnostics[0].severity).toBe(DiagnosticSeverity.Warning);
+            expect(diagnostics[0].message).toBe(ERROR_MESSAGES.FUNCTION_NOT_FOUND('summ'));
+            expect(diagnostics[0].range.start.character).toBe(4);
+            expect(diagnostics[0].range.end.character).toBe(8);
+        });
+
+        it('should accept builtins, constructors, callbacks and keywords', () => {
+            const lines = [
+                'initialize() {',
+                '    d = Dictionary("a", 1);',
+                '    if (size(d.allKeys) > 0) { catn(paste(1:3)); }',
+                '    for (i in seqLen(3)) return (i);',
+                '}',
+                '1 early() { }',
+                'mutationEffect(m1) { return 1.0; }',
+            ];
+
+            expect(validateFunctions(lines)).toEqual([]);
+        });
+
+        it('should accept user functions declared anywhere in the document', () => {
+            const lines = [
+                'x = twice(2);',
+                'function (float)twice(',
+                '    float x) {',
+                '    return 2 * x;',
+                '}',
+            ];
+
+            expect(validateFunctions(lines, 'eidos')).toEqual([]);
+        });
+
+        it('should ignore strings, comments and member calls', () => {
+            const lines = [
+                'x = "summ(1)"; // summ(2)',
+                '/* summ(3)',
+                '   summ(4) */ y = p1.summ(5);',
+            ];
+
+            expect(validateFunctions(lines)).toEqual([]);
+        });
+
+        it('should flag SLiM functions in Eidos files', () => {
+            const diagnostics = validateFunctions(['initializeMutationRate(1e-7);'], 'eidos');
+
+            expect(diagnostics.map(d => d.message)).toEqual([
+                ERROR_MESSAGES.FUNCTION_NOT_FOUND('initializeMutationRate'),
+            ]);
+        });
+    });
+
+    describe('Methods and Properties', () => {
+        it('should flag unknown members of model objects', () => {
+            const diagnostics = validateMembers([
+                '1 early() {',
+                '    p1.setMigrationRate(p2, 0.1);',
+                '    x = sim.cycl;',
+                '}',
+            ]);
+
+            expect(diagnostics.map(d => d.message)).toEqual([
+                ERROR_MESSAGES.METHOD_NOT_EXISTS('setMigrationRate', 'Subpopulation'),
+                ERROR_MESSAGES.PROPERTY_NOT_EXISTS('cycl', 'Species'),
+            ]);
+            expect(diagnostics[0].range.start).toEqual({ line: 1, character: 7 });
+            expect(diagnostics[0].range.end).toEqual({ line: 1, character: 23 });
+        });
+
+        it('should accept own and inherited members', () => {
+            const lines = [
+                '1 early() {',
+                '    inds = p1.individuals;',
+                '    p1.setValue("x", 1);',
+                '    sim.addSubpop("p2", 10);',
+                '}',
+            ];
+
+            expect(validateMembers(lines)).toEqual([]);
+        });
+
+        it('should not check variables typed from their assignments or later chain links', () => {
+            const lines = [
+                '1 early() {',
+                '    x = sim.mutations[0].chromosome.genomicElements.genomicElementType;',
+                '    x.setMutationFractions(m1, 1.0);',
+                '    y = p1.individuals.notAMember;',
+                '}',
+            ];
+
+            expect(validateMembers(lines)).toEqual([]);
+        });
+    });
+});